@@ -5,21 +5,90 @@ Single responsibility: input model, file helpers, and performing the code review
 via LiteLLM.
 """
 
+import asyncio
+import json
 import logging
+import os
+import re
 import tempfile
 from collections import defaultdict
+from collections.abc import Awaitable, Callable, Mapping
 from pathlib import Path
-from typing import Literal, Optional
+from types import MappingProxyType
+from typing import Any, Literal, Optional
 
+import httpx
 import litellm
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 import config as config_module
+import llm_cache
 import prompt as prompt_module
+from rate_limit import per_minute_bucket, retry_with_backoff
 from review_strategy import ReviewOrchestrator, add_line_numbers_to_section
 
 logger = logging.getLogger(__name__)
 
+# Async callback receiving (completed, total) review progress.
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
+# Timeout for a single LLM HTTP request (large reviews can take a while).
+_LLM_HTTP_TIMEOUT = httpx.Timeout(120.0)
+
+# "[LINE N] comment" review line; group 1 is N, group 2 the comment text.
+_REVIEW_LINE_RE = re.compile(r"^\s*\[LINE\s+(\d+)\s*\]\s*(.*?)\s*$")
+
+# Inline comment syntax per file extension: (comment_prefix, comment_suffix).
+# Read-only and built once at import.
+_COMMENT_STYLES: Mapping[str, tuple[str, str]] = MappingProxyType(
+    {
+        ".py": ("#", ""),
+        ".js": ("//", ""),
+        ".ts": ("//", ""),
+        ".jsx": ("//", ""),
+        ".tsx": ("//", ""),
+        ".java": ("//", ""),
+        ".c": ("//", ""),
+        ".cpp": ("//", ""),
+        ".cs": ("//", ""),
+        ".go": ("//", ""),
+        ".rs": ("//", ""),
+        ".rb": ("#", ""),
+        ".sh": ("#", ""),
+        ".yaml": ("#", ""),
+        ".yml": ("#", ""),
+        ".html": ("<!--", " -->"),
+        ".css": ("/*", " */"),
+        ".sql": ("--", ""),
+    }
+)
+_DEFAULT_COMMENT_STYLE = ("#", "")
+
+# Rough characters-per-token ratio used for prompt size estimates.
+_CHARS_PER_TOKEN = 4
+
+# Transient provider errors worth retrying (429, 5xx, dropped connections, timeouts).
+_RETRYABLE_LLM_ERRORS: tuple[type[BaseException], ...] = (
+    litellm.RateLimitError,
+    litellm.InternalServerError,
+    litellm.ServiceUnavailableError,
+    litellm.APIConnectionError,
+    litellm.Timeout,
+)
+
+# Client-side RPM / TPM governors (None when LLM_RPM / LLM_TPM are unset).
+_rpm_bucket = per_minute_bucket(config_module.settings.llm_rpm)
+_tpm_bucket = per_minute_bucket(config_module.settings.llm_tpm)
+
+# Pre-warm requests should never hold up startup for long.
+_PREWARM_TIMEOUT = httpx.Timeout(5.0)
+# Number of keep-alive connections to open at startup.
+_PREWARM_CONNECTIONS = 2
+
+# Process-wide HTTP client shared with LiteLLM so calls reuse pooled keep-alive
+# connections instead of paying a TCP+TLS handshake per request.
+_http_client: httpx.AsyncClient | None = None
+
 
 class ReviewFileInput(BaseModel):
     """Input model for code review tool."""
@@ -49,15 +118,14 @@ class ReviewFileInput(BaseModel):
     @field_validator("file_path")
     @classmethod
     def validate_file_path(cls, v: str) -> str:
-        """Validate that file path is relative and doesn't attempt path traversal."""
-        if v.startswith("/"):
-            raise ValueError(
-                "File path must be relative and cannot contain '..' or start with '/'"
-            )
-        parts = Path(v).parts
-        if ".." in parts:
+        """Validate that file path is relative.
+
+        Workspace containment ('..', symlinks) is enforced when the path is
+        resolved (utils.safe_resolve), not here.
+        """
+        if v.startswith("/") or "\x00" in v:
             raise ValueError(
-                "File path must be relative and cannot contain '..' or start with '/'"
+                "File path must be relative and cannot start with '/' or contain NUL bytes"
             )
         return v
 
@@ -65,22 +133,29 @@ class ReviewFileInput(BaseModel):
 def add_line_numbers(content: str) -> str:
     """Add line numbers to file content for easier reference in reviews."""
     lines = content.splitlines()
-    numbered_lines = [f"{i + 1:4d} | {line}" for i, line in enumerate(lines)]
-    return "\n".join(numbered_lines)
+    # map + str.__mod__ keeps the per-line formatting loop in C.
+    return "\n".join(map("%4d | %s".__mod__, zip(range(1, len(lines) + 1), lines)))
 
 
 def read_file_content(file_path: Path) -> str:
-    """Read file content, attempting UTF-8 first, falling back to latin-1 if decoding fails."""
+    """Read file content, attempting UTF-8 first, falling back to latin-1 if decoding fails.
+
+    The file is read from disk once; the latin-1 fallback decodes the same bytes.
+    Newlines are normalized to "\\n" (as text-mode reads do).
+    """
+    data = file_path.read_bytes()
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return f.read()
+        text = data.decode("utf-8")
     except UnicodeDecodeError:
         logger.warning(
             "File %s could not be decoded as UTF-8; falling back to latin-1",
             file_path,
         )
-        with open(file_path, "r", encoding="latin-1") as f:
-            return f.read()
+        text = data.decode("latin-1")
+    del data  # Release the raw bytes before any newline rewrite copies the text.
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
 def write_review_comments(file_path: Path, original_content: str, review: str) -> None:
@@ -95,29 +170,8 @@ def write_review_comments(file_path: Path, original_content: str, review: str) -
         review: Raw review text from the LLM (may contain [LINE N] ... lines).
     """
     ext = file_path.suffix.lower()
-    # Each value is (comment_prefix, comment_suffix) for inline comments.
-    comment_styles: dict[str, tuple[str, str]] = {
-        ".py": ("#", ""),
-        ".js": ("//", ""),
-        ".ts": ("//", ""),
-        ".jsx": ("//", ""),
-        ".tsx": ("//", ""),
-        ".java": ("//", ""),
-        ".c": ("//", ""),
-        ".cpp": ("//", ""),
-        ".cs": ("//", ""),
-        ".go": ("//", ""),
-        ".rs": ("//", ""),
-        ".rb": ("#", ""),
-        ".sh": ("#", ""),
-        ".yaml": ("#", ""),
-        ".yml": ("#", ""),
-        ".html": ("<!--", " -->"),
-        ".css": ("/*", " */"),
-        ".sql": ("--", ""),
-    }
-    comment_prefix, comment_suffix = comment_styles.get(ext, ("#", ""))
-    if ext not in comment_styles and ext:
+    comment_prefix, comment_suffix = _COMMENT_STYLES.get(ext, _DEFAULT_COMMENT_STYLE)
+    if ext not in _COMMENT_STYLES and ext:
         logger.warning(
             "Unknown file extension %r; using # for comments. Review may not render correctly.",
             ext,
@@ -133,62 +187,74 @@ def write_review_comments(file_path: Path, original_content: str, review: str) -
             comments_by_line[current_line_num].append("\n".join(current_comment_lines))
 
     for line in review_lines:
-        if line.strip().startswith("[LINE "):
+        match = _REVIEW_LINE_RE.match(line)
+        if match:
+            flush_comment()
+            current_line_num = int(match.group(1))
+            current_comment_lines = [match.group(2)]
+        elif line.lstrip().startswith("[LINE "):
             flush_comment()
-            try:
-                parts = line.split("]", 1)
-                if len(parts) != 2:
-                    continue
-                line_num = int(parts[0].replace("[LINE ", "").strip())
-                comment_text = parts[1].strip()
-                current_line_num = line_num
-                current_comment_lines = [comment_text]
-            except (ValueError, IndexError):
-                logger.debug("Skipping malformed review line: %r", line[:80])
-                current_line_num = None
-                current_comment_lines = []
+            logger.debug("Skipping malformed review line: %r", line[:80])
+            current_line_num = None
+            current_comment_lines = []
         elif current_line_num is not None:
             current_comment_lines.append(line.strip())
 
     flush_comment()
 
     if not comments_by_line:
-        header = f"{comment_prefix} === CODE REVIEW RESULTS ==={comment_suffix}\n"
-        for rev_line in review_lines:
-            header += f"{comment_prefix} {rev_line}{comment_suffix}\n"
-        header += f"{comment_prefix} {'=' * 50}{comment_suffix}\n\n"
-        _atomic_write(file_path, header + original_content)
+        header_lines = [f"{comment_prefix} === CODE REVIEW RESULTS ==={comment_suffix}"]
+        header_lines.extend(
+            f"{comment_prefix} {rev_line}{comment_suffix}" for rev_line in review_lines
+        )
+        header_lines.append(f"{comment_prefix} {'=' * 50}{comment_suffix}")
+        _atomic_write(file_path, "\n".join(header_lines) + "\n\n" + original_content)
         return
 
-    original_lines = original_content.splitlines()
-    new_lines = []
-    for i, line in enumerate(original_lines, start=1):
-        if i in comments_by_line:
-            new_lines.append(
-                f"{comment_prefix} === CODE REVIEW COMMENT ==={comment_suffix}"
-            )
-            for comment in comments_by_line[i]:
-                for comment_line in comment.splitlines():
-                    new_lines.append(
-                        f"{comment_prefix} {comment_line}{comment_suffix}"
-                    )
-            new_lines.append(f"{comment_prefix} {'=' * 50}{comment_suffix}")
-        new_lines.append(line)
+    # Render each comment block once; the per-line loop then only does a dict lookup.
+    block_header = f"{comment_prefix} === CODE REVIEW COMMENT ==={comment_suffix}"
+    block_footer = f"{comment_prefix} {'=' * 50}{comment_suffix}"
+    rendered_blocks = {
+        line_num: "\n".join(
+            [
+                block_header,
+                *(
+                    f"{comment_prefix} {comment_line}{comment_suffix}"
+                    for comment in comments
+                    for comment_line in comment.splitlines()
+                ),
+                block_footer,
+            ]
+        )
+        for line_num, comments in comments_by_line.items()
+    }
+
+    new_lines: list[str] = []
+    append = new_lines.append
+    get_block = rendered_blocks.get
+    for i, line in enumerate(original_content.splitlines(), start=1):
+        block = get_block(i)
+        if block is not None:
+            append(block)
+        append(line)
 
     _atomic_write(file_path, "\n".join(new_lines))
 
 
 def _atomic_write(file_path: Path, content: str) -> None:
-    """Write content to file atomically (temp file + rename) to avoid corruption on failure."""
-    import os
+    """Write content to file atomically and durably.
 
-    fd, tmp_path = tempfile.mkstemp(
-        dir=file_path.parent, prefix=".review_", suffix=".tmp"
-    )
+    Writes a temp file in the same directory, fsyncs it, renames it over the
+    target, then fsyncs the directory so the rename survives a crash.
+    """
+    dir_path = file_path.parent
+    fd, tmp_path = tempfile.mkstemp(dir=dir_path, prefix=".review_", suffix=".tmp")
     try:
         with open(fd, "w", encoding="utf-8") as f:
             f.write(content)
-        Path(tmp_path).replace(file_path)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
     except Exception:
         try:
             os.close(fd)
@@ -196,19 +262,105 @@ def _atomic_write(file_path: Path, content: str) -> None:
             pass
         Path(tmp_path).unlink(missing_ok=True)
         raise
+    _fsync_dir(dir_path)
+
+
+def _fsync_dir(dir_path: Path) -> None:
+    """Best-effort fsync of a directory (persists renames; unsupported on some platforms)."""
+    try:
+        dir_fd = os.open(dir_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared LLM HTTP client, creating it (and registering it with LiteLLM) if needed."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        cfg = config_module.settings
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=cfg.llm_max_connections,
+                max_keepalive_connections=cfg.llm_max_keepalive,
+            ),
+            timeout=_LLM_HTTP_TIMEOUT,
+        )
+        litellm.aclient_session = _http_client
+    return _http_client
+
+
+async def prewarm_http_client() -> None:
+    """Open keep-alive connections to the LLM endpoint so the first review skips the handshake.
+
+    Best-effort: failures are logged and ignored.
+    """
+    cfg = config_module.settings
+    client = get_http_client()
+    url = cfg.llm_base_url.rstrip("/") + "/models"
+    headers = {"Authorization": f"Bearer {cfg.llm_api_key}"}
+    results = await asyncio.gather(
+        *(
+            client.head(url, headers=headers, timeout=_PREWARM_TIMEOUT)
+            for _ in range(_PREWARM_CONNECTIONS)
+        ),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.debug(
+                "LLM connection pre-warm failed: %s: %s", type(result).__name__, result
+            )
+            return
+    logger.info("Pre-warmed %s LLM connection(s): url=%s", len(results), url)
+
+
+async def aclose_http_client() -> None:
+    """Close the shared LLM HTTP client; a new one is created on next use."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        if litellm.aclient_session is _http_client:
+            litellm.aclient_session = None
+        _http_client = None
+
+
+async def _call_llm(messages: list[dict[str, Any]]) -> str:
+    """Call LiteLLM with the given chat messages and return response text (served from cache if enabled)."""
+    cache_text = json.dumps(messages, sort_keys=True, ensure_ascii=False)
+    return await llm_cache.get_or_set(
+        cache_text, lambda: _request_completion(messages)
+    )
 
 
-async def _call_llm(prompt: str) -> str:
-    """Call LiteLLM with the given prompt and return response text."""
+async def _request_completion(messages: list[dict[str, Any]]) -> str:
+    """Send the messages to LiteLLM and return response text."""
     cfg = config_module.settings
-    messages = [{"role": "user", "content": prompt}]
-    response = await litellm.acompletion(
-        model=cfg.llm_model,
-        messages=messages,
-        api_base=cfg.llm_base_url,
-        api_key=cfg.llm_api_key,
-        temperature=0.3,
-        max_tokens=8192,
+    get_http_client()
+    prompt_tokens = _estimate_message_tokens(messages)
+
+    async def _attempt() -> Any:
+        # Every attempt (including retries) goes through the RPM/TPM governor.
+        if _rpm_bucket is not None:
+            await _rpm_bucket.acquire(1)
+        if _tpm_bucket is not None:
+            await _tpm_bucket.acquire(prompt_tokens)
+        return await litellm.acompletion(
+            model=cfg.llm_model,
+            messages=messages,
+            api_base=cfg.llm_base_url,
+            api_key=cfg.llm_api_key,
+            temperature=0.3,
+            max_tokens=8192,
+        )
+
+    response = await retry_with_backoff(
+        _attempt, _RETRYABLE_LLM_ERRORS, cfg.llm_num_retries
     )
     if not response.choices:
         logger.warning("LLM returned no choices")
@@ -220,10 +372,29 @@ async def _call_llm(prompt: str) -> str:
     return content
 
 
+def estimate_tokens(text: str) -> int:
+    """Cheap token-count estimate for prompt sizing (no tokenizer call)."""
+    return len(text) // _CHARS_PER_TOKEN + 1
+
+
+def _estimate_message_tokens(messages: list[dict[str, Any]]) -> int:
+    """Estimate prompt tokens for chat messages (str or text-part content)."""
+    total = 0
+    for message in messages:
+        content = message["content"]
+        if isinstance(content, str):
+            total += estimate_tokens(content)
+        else:
+            total += sum(estimate_tokens(part.get("text", "")) for part in content)
+    return total
+
+
 async def perform_code_review(
     file_path: Path,
     review_depth: str,
     focus_areas: Optional[str],
+    content: Optional[str] = None,
+    progress_cb: Optional[ProgressCallback] = None,
 ) -> str:
     """Perform code review using LiteLLM and the configured LLM proxy.
 
@@ -234,23 +405,41 @@ async def perform_code_review(
         file_path: Path to the file to review.
         review_depth: One of 'quick', 'standard', 'thorough'.
         focus_areas: Optional focus areas string.
+        content: File content if the caller already read it (avoids a second read).
+        progress_cb: Optional async callback called with (completed, total) as
+            sections (or the whole file) finish reviewing.
 
     Returns:
         Raw review text from the LLM (all sections merged for section-based path).
     """
-    content = read_file_content(file_path)
+    if content is None:
+        content = await asyncio.to_thread(read_file_content, file_path)
     orchestrator = ReviewOrchestrator()
 
     if not orchestrator.should_split(content, file_path):
-        return await _perform_whole_file_review(
+        result = await _perform_whole_file_review(
             file_path, content, review_depth, focus_areas
         )
+        await _report_progress(progress_cb, 1, 1)
+        return result
 
     return await _perform_section_based_review(
-        file_path, content, review_depth, focus_areas, orchestrator
+        file_path, content, review_depth, focus_areas, orchestrator, progress_cb
     )
 
 
+async def _report_progress(
+    progress_cb: Optional[ProgressCallback], completed: int, total: int
+) -> None:
+    """Invoke the progress callback if set; failures are logged, never raised."""
+    if progress_cb is None:
+        return
+    try:
+        await progress_cb(completed, total)
+    except Exception as e:
+        logger.debug("Progress callback failed: %s: %s", type(e).__name__, e)
+
+
 async def _perform_whole_file_review(
     file_path: Path,
     content: str,
@@ -268,19 +457,123 @@ async def _perform_whole_file_review(
     prompt = prompt_module.build_review_prompt(
         file_path, numbered_content, review_depth, focus_areas
     )
-    result = await _call_llm(prompt)
+    result = await _call_llm([{"role": "user", "content": prompt}])
     logger.info("Whole-file review completed: path=%s", file_path)
     return result
 
 
+def _group_section_batches(
+    section_contexts: list[dict[str, Any]], batch_size: int, token_cap: int
+) -> list[list[int]]:
+    """Group consecutive sections into batches of indices.
+
+    A batch holds at most batch_size sections and its combined estimated tokens
+    stay under token_cap; a section larger than the cap gets its own batch.
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    current_tokens = 0
+    for index, section_context in enumerate(section_contexts):
+        tokens = estimate_tokens(section_context["section_text"])
+        if current and (
+            len(current) >= batch_size or current_tokens + tokens > token_cap
+        ):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(index)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def _perform_batched_section_review(
+    file_path: Path,
+    section_contexts: list[dict[str, Any]],
+    review_depth: str,
+    focus_areas: Optional[str],
+    orchestrator: ReviewOrchestrator,
+    call_llm: Callable[[list[dict[str, Any]]], Awaitable[str]],
+    progress_cb: Optional[ProgressCallback] = None,
+) -> list[str]:
+    """Review sections concurrently, packing small ones into shared LLM calls.
+
+    Batch size and size cap come from ``llm_batch_size`` / ``llm_batch_token_cap``
+    (batch size 1 disables batching). A section missing from a batched response
+    is retried on its own. progress_cb is called as each batch completes.
+
+    Returns:
+        One response text per section, in the order of section_contexts.
+    """
+    cfg = config_module.settings
+    batches = _group_section_batches(
+        section_contexts, cfg.llm_batch_size, cfg.llm_batch_token_cap
+    )
+    logger.info(
+        "Reviewing %s section(s) in %s call(s) with up to %s concurrent: path=%s",
+        len(section_contexts),
+        len(batches),
+        cfg.llm_max_concurrency,
+        file_path,
+    )
+
+    def _single_prompt(index: int) -> list[dict[str, Any]]:
+        return prompt_module.build_section_review_prompt(
+            file_path, section_contexts[index], review_depth, focus_areas
+        )
+
+    async def _review_batch(batch: list[int]) -> dict[int, str]:
+        if len(batch) == 1:
+            return {batch[0]: await call_llm(_single_prompt(batch[0]))}
+
+        messages = prompt_module.build_section_batch_review_prompt(
+            file_path, [section_contexts[i] for i in batch], review_depth, focus_areas
+        )
+        blocks = orchestrator.split_batch_response(await call_llm(messages), len(batch))
+        results = {batch[position]: block for position, block in blocks.items()}
+        missing = [i for i in batch if i not in results]
+        if missing:
+            logger.warning(
+                "Batched response missing %s of %s section(s); retrying individually: path=%s",
+                len(missing),
+                len(batch),
+                file_path,
+            )
+            retried = await asyncio.gather(
+                *(call_llm(_single_prompt(i)) for i in missing)
+            )
+            results.update(zip(missing, retried))
+        return results
+
+    responses: list[str] = [""] * len(section_contexts)
+    completed = 0
+
+    async def _review_batch_and_report(batch: list[int]) -> None:
+        nonlocal completed
+        for index, response in (await _review_batch(batch)).items():
+            responses[index] = response
+        completed += len(batch)
+        await _report_progress(progress_cb, completed, len(section_contexts))
+
+    await asyncio.gather(*(_review_batch_and_report(b) for b in batches))
+    return responses
+
+
 async def _perform_section_based_review(
     file_path: Path,
     content: str,
     review_depth: str,
     focus_areas: Optional[str],
     orchestrator: ReviewOrchestrator,
+    progress_cb: Optional[ProgressCallback] = None,
 ) -> str:
-    """Perform section-based review with context request support."""
+    """Perform section-based review with context request support.
+
+    Sections are independent, so their prompts are sent concurrently (bounded by
+    ``llm_max_concurrency``, small sections batched per call). Context-request
+    follow-ups are issued in a second concurrent pass once all section responses
+    are in.
+    """
     logger.info(
         "Starting section-based review: path=%s depth=%s focus=%s max_iter=%s",
         file_path,
@@ -292,36 +585,55 @@ async def _perform_section_based_review(
     num_sections = len(orchestrator.sections)
     logger.info("Prepared %s section(s) for review: path=%s", num_sections, file_path)
 
-    for section_index in range(num_sections):
-        if orchestrator.iterations_used >= orchestrator.max_iterations:
-            logger.warning(
-                "Stopping section loop: max iterations reached (%s): path=%s",
-                orchestrator.max_iterations,
-                file_path,
-            )
-            break
+    semaphore = asyncio.Semaphore(config_module.settings.llm_max_concurrency)
+
+    async def _bounded_call_llm(messages: list[dict[str, Any]]) -> str:
+        async with semaphore:
+            return await _call_llm(messages)
 
-        section = orchestrator.sections[section_index]
+    reviewable = [
+        section
+        for section in orchestrator.sections
+        if orchestrator.should_review(section, file_path)
+    ]
+    if len(reviewable) < num_sections:
         logger.info(
-            "Reviewing section %s/%s (iter %s/%s): path=%s",
-            section_index + 1,
-            num_sections,
-            orchestrator.iterations_used + 1,
+            "Skipping %s trivial section(s): path=%s",
+            num_sections - len(reviewable),
+            file_path,
+        )
+    sections = reviewable[: orchestrator.max_iterations]
+    if len(sections) < len(reviewable):
+        logger.warning(
+            "Skipping %s section(s): max iterations reached (%s): path=%s",
+            len(reviewable) - len(sections),
             orchestrator.max_iterations,
             file_path,
         )
 
-        section_numbered = add_line_numbers_to_section(section)
+    # Pass 1: review every section concurrently (small sections batched per call).
+    section_contexts = []
+    for section in sections:
         section_context = orchestrator.get_section_context_for_review(section)
-        section_context["section_text"] = section_numbered
+        section_context["section_text"] = add_line_numbers_to_section(section)
+        section_contexts.append(section_context)
 
-        prompt = prompt_module.build_section_review_prompt(
-            file_path, section_context, review_depth, focus_areas
-        )
-        review_response = await _call_llm(prompt)
+    responses = await _perform_batched_section_review(
+        file_path,
+        section_contexts,
+        review_depth,
+        focus_areas,
+        orchestrator,
+        _bounded_call_llm,
+        progress_cb,
+    )
 
-        comments = orchestrator.parse_review_comments(review_response)
-        orchestrator.accumulated_reviews.extend(comments)
+    comments_by_section: list[list[str]] = []
+    context_requests: list[Optional[str]] = []
+    for section_index, review_response in enumerate(responses):
+        comments, context_request = orchestrator.parse_response(review_response)
+        comments_by_section.append(comments)
+        context_requests.append(context_request)
         orchestrator.iterations_used += 1
         logger.debug(
             "Section %s produced %s comment(s): path=%s",
@@ -330,45 +642,68 @@ async def _perform_section_based_review(
             file_path,
         )
 
-        context_request = orchestrator.parse_context_request(review_response)
-
+    # Pass 2: resolve context requests (in section order, within the iteration
+    # budget) and send the follow-ups concurrently.
+    followup_indices: list[int] = []
+    followup_prompts: list[list[dict[str, Any]]] = []
+    for section_index, context_request in enumerate(context_requests):
+        if not context_request:
+            continue
         if (
-            context_request
-            and orchestrator.iterations_used < orchestrator.max_iterations
+            orchestrator.iterations_used + len(followup_prompts)
+            >= orchestrator.max_iterations
         ):
-            logger.info(
-                "Context request for section: request=%s path=%s",
+            logger.warning(
+                "Ignoring context request: max iterations reached (%s): request=%s path=%s",
+                orchestrator.max_iterations,
+                context_request,
+                file_path,
+            )
+            continue
+
+        logger.info(
+            "Context request for section: request=%s path=%s",
+            context_request,
+            file_path,
+        )
+        requested_section = orchestrator.resolve_section_identifier(context_request)
+        if requested_section is None:
+            logger.warning(
+                "Context request could not resolve section: request=%s path=%s",
                 context_request,
                 file_path,
             )
-            requested_section = orchestrator.resolve_section_identifier(context_request)
-
-            if requested_section:
-                requested_numbered = add_line_numbers_to_section(requested_section)
-
-                followup_prompt = prompt_module.build_section_context_followup_prompt(
-                    file_path, section_context, requested_numbered
-                )
-                followup_response = await _call_llm(followup_prompt)
-
-                followup_comments = orchestrator.parse_review_comments(
-                    followup_response
-                )
-                orchestrator.accumulated_reviews.extend(followup_comments)
-                orchestrator.iterations_used += 1
-                logger.info(
-                    "Context followup completed: +%s comment(s) iter=%s/%s path=%s",
-                    len(followup_comments),
-                    orchestrator.iterations_used,
-                    orchestrator.max_iterations,
-                    file_path,
-                )
-            else:
-                logger.warning(
-                    "Context request could not resolve section: request=%s path=%s",
-                    context_request,
-                    file_path,
-                )
+            continue
+
+        requested_numbered = add_line_numbers_to_section(requested_section)
+        followup_indices.append(section_index)
+        followup_prompts.append(
+            prompt_module.build_section_context_followup_prompt(
+                file_path,
+                section_contexts[section_index],
+                requested_numbered,
+                review_depth,
+                focus_areas,
+            )
+        )
+
+    followup_responses = await asyncio.gather(
+        *(_bounded_call_llm(p) for p in followup_prompts)
+    )
+    for section_index, followup_response in zip(followup_indices, followup_responses):
+        followup_comments = orchestrator.parse_review_comments(followup_response)
+        comments_by_section[section_index].extend(followup_comments)
+        orchestrator.iterations_used += 1
+        logger.info(
+            "Context followup completed: +%s comment(s) iter=%s/%s path=%s",
+            len(followup_comments),
+            orchestrator.iterations_used,
+            orchestrator.max_iterations,
+            file_path,
+        )
+
+    for comments in comments_by_section:
+        orchestrator.accumulated_reviews.extend(comments)
 
     total_comments = len(orchestrator.accumulated_reviews)
     logger.info(
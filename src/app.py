@@ -5,23 +5,64 @@ Single responsibility: FastMCP instance and tool handlers
 (review_code_file, list_workspace_files).
 """
 
-from mcp.server.fastmcp import FastMCP
+import asyncio
+import os
+import stat
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field, ValidationError
 
 import config as config_module
-from agent import perform_code_review, read_file_content, write_review_comments
+from agent import (
+    ProgressCallback,
+    aclose_http_client,
+    perform_code_review,
+    prewarm_http_client,
+    read_file_content,
+    write_review_comments,
+)
 from utils import (
     REVIEW_CODE_FILE_USAGE,
+    git_list_files_in_dir,
+    list_files_in_dir,
     parse_review_params,
     resolve_file_in_workspace,
+    safe_resolve,
 )
 
-mcp = FastMCP("code_review_mcp")
+
+@asynccontextmanager
+async def _lifespan(_server: FastMCP) -> AsyncIterator[None]:
+    """Server lifespan: pre-warm LLM connections on startup, close them on shutdown."""
+    # Run in the background so the handshake never delays MCP initialization.
+    prewarm_task = asyncio.create_task(prewarm_http_client())
+    try:
+        yield
+    finally:
+        prewarm_task.cancel()
+        await asyncio.gather(prewarm_task, return_exceptions=True)
+        await aclose_http_client()
+
+
+mcp = FastMCP("code_review_mcp", lifespan=_lifespan)
 
 # Max file size for review (10MB).
 _MAX_REVIEW_FILE_SIZE = 10 * 1024 * 1024
 
 
+def _progress_reporter(ctx: Context | None) -> ProgressCallback | None:
+    """Adapt the MCP request context into a review progress callback."""
+    if ctx is None:
+        return None
+
+    async def report(completed: int, total: int) -> None:
+        await ctx.report_progress(completed, total)
+
+    return report
+
+
 @mcp.tool(
     name="review_code_file",
     annotations={
@@ -32,7 +73,7 @@ _MAX_REVIEW_FILE_SIZE = 10 * 1024 * 1024
         "openWorldHint": True,
     },
 )
-async def review_code_file(params: object) -> str:
+async def review_code_file(params: object, ctx: Context = None) -> str:
     """Review a code file and add inline comments with suggestions and improvements.
 
     This tool performs AI-powered code review using LiteLLM and your configured LLM proxy. It analyzes
@@ -43,6 +84,8 @@ async def review_code_file(params: object) -> str:
         params: Review parameters as a dict or JSON string with keys: file_path (required, relative path
             within workspace, e.g. 'src/main.py'), review_depth ('quick' | 'standard' | 'thorough'),
             focus_areas (optional, e.g. 'security, performance').
+        ctx: MCP request context (injected by FastMCP); used to stream progress
+            notifications as sections finish when the client sent a progress token.
 
     Returns:
         Success message with file path, or error message if review failed.
@@ -57,30 +100,37 @@ async def review_code_file(params: object) -> str:
 
     try:
         workspace_dir = config_module.settings.workspace_dir
-        full_path = resolve_file_in_workspace(workspace_dir, parsed.file_path)
-        if full_path is None:
+        # Blocking filesystem work runs in a worker thread so other tool calls keep going.
+        full_path = await asyncio.to_thread(
+            resolve_file_in_workspace, workspace_dir, parsed.file_path
+        )
+        # One stat call answers exists / is-file / size together.
+        try:
+            st = None if full_path is None else await asyncio.to_thread(os.stat, full_path)
+        except FileNotFoundError:
+            st = None
+        if st is None:
             return (
                 f"Error: File not found: {parsed.file_path}\n"
                 f"Workspace directory: {workspace_dir}\n"
                 "No file under the workspace matches that path or path suffix."
             )
-        workspace_resolved = workspace_dir.resolve()
-        if not full_path.is_relative_to(workspace_resolved):
-            return f"Error: Path escapes workspace: {parsed.file_path}"
-
-        if not full_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return f"Error: Path is not a file: {parsed.file_path}"
-
-        if full_path.stat().st_size > _MAX_REVIEW_FILE_SIZE:
+        if st.st_size > _MAX_REVIEW_FILE_SIZE:
             return f"Error: File too large for review (max 10MB): {parsed.file_path}"
 
-        original_content = read_file_content(full_path)
+        original_content = await asyncio.to_thread(read_file_content, full_path)
         review_result = await perform_code_review(
             full_path,
             parsed.review_depth,
             parsed.focus_areas,
+            content=original_content,
+            progress_cb=_progress_reporter(ctx),
+        )
+        await asyncio.to_thread(
+            write_review_comments, full_path, original_content, review_result
         )
-        write_review_comments(full_path, original_content, review_result)
         resolved_rel = str(full_path.relative_to(workspace_dir)).replace("\\", "/")
         return (
             f"✅ Review completed. Comments added to: {resolved_rel}\n\n"
@@ -118,9 +168,9 @@ async def list_workspace_files(
     """
     try:
         workspace_dir = config_module.settings.workspace_dir
-        target_dir = (workspace_dir / directory).resolve()
-        workspace_resolved = workspace_dir.resolve()
-        if not target_dir.is_relative_to(workspace_resolved):
+        workspace_resolved = config_module.settings.workspace_resolved
+        target_dir = safe_resolve(workspace_resolved, directory)
+        if target_dir is None:
             return f"Error: Directory path escapes workspace: {directory}"
 
         if not target_dir.exists():
@@ -129,22 +179,20 @@ async def list_workspace_files(
         if not target_dir.is_dir():
             return f"Error: Path is not a directory: {directory}"
 
-        ignore_dirs = {".git", "node_modules", "__pycache__", ".venv", "venv"}
-        files = []
-        for path in sorted(target_dir.rglob("*")):
-            if path.is_file():
-                if any(ign in path.parts for ign in ignore_dirs):
-                    continue
-                relative_path = path.relative_to(workspace_dir)
-                files.append(str(relative_path))
+        files = None
+        if (workspace_resolved / ".git").exists():
+            files = await git_list_files_in_dir(target_dir, workspace_dir)
+        if files is None:
+            files = await asyncio.to_thread(
+                list_files_in_dir, target_dir, workspace_dir
+            )
 
         if not files:
             return f"No files found in: {directory}"
 
-        result = f"Files in workspace (total: {len(files)}):\n\n"
-        for file_path in files:
-            result += f"  - {file_path}\n"
-        return result
+        return f"Files in workspace (total: {len(files)}):\n\n" + "".join(
+            f"  - {file_path}\n" for file_path in files
+        )
     except Exception as e:
         return f"Error listing files: {type(e).__name__}: {str(e)}"
 
@@ -7,7 +7,7 @@ Docker Compose injects env from .env automatically; load_dotenv() is a no-op if
 
 import os
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -23,6 +23,20 @@ class Settings:
     llm_api_key: str
     llm_model: str
     workspace_dir: Path
+    llm_max_concurrency: int = 8
+    llm_max_connections: int = 200
+    llm_max_keepalive: int = 100
+    llm_rpm: int = 0
+    llm_tpm: int = 0
+    llm_num_retries: int = 3
+    llm_batch_size: int = 4
+    llm_batch_token_cap: int = 6000
+    review_cache: bool = False
+    # Canonical workspace root, resolved once so tool calls don't re-run realpath.
+    workspace_resolved: Path = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "workspace_resolved", self.workspace_dir.resolve())
 
     def __repr__(self) -> str:
         """Repr that masks API key to avoid accidental exposure in logs."""
@@ -30,12 +44,44 @@ class Settings:
             f"Settings(llm_base_url={self.llm_base_url!r}, "
             "llm_api_key='***REDACTED***', "
             f"llm_model={self.llm_model!r}, "
-            f"workspace_dir={self.workspace_dir!r})"
+            f"workspace_dir={self.workspace_dir!r}, "
+            f"llm_max_concurrency={self.llm_max_concurrency!r}, "
+            f"llm_max_connections={self.llm_max_connections!r}, "
+            f"llm_max_keepalive={self.llm_max_keepalive!r}, "
+            f"llm_rpm={self.llm_rpm!r}, "
+            f"llm_tpm={self.llm_tpm!r}, "
+            f"llm_num_retries={self.llm_num_retries!r}, "
+            f"llm_batch_size={self.llm_batch_size!r}, "
+            f"llm_batch_token_cap={self.llm_batch_token_cap!r}, "
+            f"review_cache={self.review_cache!r})"
         )
 
     __str__ = __repr__
 
 
+def _get_int(name: str, default: int, minimum: int = 1) -> int:
+    """Read an optional integer env var (>= minimum); exit with error if it is invalid."""
+    raw = os.getenv(name)
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = minimum - 1
+    if value < minimum:
+        print(
+            f"ERROR: {name} must be an integer >= {minimum}, got {raw!r}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    return value
+
+
+def _get_flag(name: str) -> bool:
+    """Read an optional boolean env var (1/true/yes/on enable it)."""
+    return os.getenv(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
 def get_settings() -> Settings:
     """Load and validate settings; exit with error if required vars are missing."""
     missing = []
@@ -66,6 +112,15 @@ def get_settings() -> Settings:
         llm_api_key=llm_api_key,
         llm_model=llm_model,
         workspace_dir=workspace_dir,
+        llm_max_concurrency=_get_int("LLM_MAX_CONCURRENCY", 8),
+        llm_max_connections=_get_int("LLM_MAX_CONNECTIONS", 200),
+        llm_max_keepalive=_get_int("LLM_MAX_KEEPALIVE", 100),
+        llm_rpm=_get_int("LLM_RPM", 0, minimum=0),
+        llm_tpm=_get_int("LLM_TPM", 0, minimum=0),
+        llm_num_retries=_get_int("LLM_NUM_RETRIES", 3, minimum=0),
+        llm_batch_size=_get_int("LLM_BATCH_SIZE", 4),
+        llm_batch_token_cap=_get_int("LLM_BATCH_TOKEN_CAP", 6000),
+        review_cache=_get_flag("REVIEW_CACHE"),
     )
 
 
@@ -0,0 +1,103 @@
+"""
+On-disk LLM response cache for the Code Review MCP server.
+
+Single responsibility: content-addressed storage of LLM responses keyed by a
+hash of (model, prompt), so re-reviewing unchanged code skips the LLM call.
+Opt-in via REVIEW_CACHE=1; invalidate by deleting the cache directory.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+import weakref
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import config as config_module
+
+logger = logging.getLogger(__name__)
+
+# Cache directory name, created under the workspace root.
+CACHE_DIR_NAME = ".review_cache"
+
+# Per-key locks so concurrent identical prompts only hit the LLM once.
+# Entries disappear once no coroutine holds the lock.
+_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def cache_key(model: str, prompt: str) -> str:
+    """Return the hex cache key for a prompt sent to the given model."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(model.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(prompt.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def cache_path(cache_dir: Path, key: str) -> Path:
+    """Return the file path for a cache key (sharded by the first two hex chars)."""
+    return cache_dir / key[:2] / f"{key}.txt"
+
+
+def _read_cached(path: Path) -> str | None:
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def _write_cached(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".cache_", suffix=".tmp")
+    try:
+        with open(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except Exception:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+async def get_or_set(prompt: str, coro_factory: Callable[[], Awaitable[str]]) -> str:
+    """Return the cached response for prompt, or await coro_factory() and cache it.
+
+    When caching is disabled this simply awaits coro_factory(). Empty responses
+    are not cached; cache I/O errors are logged and never fail the review.
+
+    Args:
+        prompt: Full prompt text (part of the cache key).
+        coro_factory: Zero-arg callable returning the awaitable LLM call.
+
+    Returns:
+        Response text.
+    """
+    cfg = config_module.settings
+    if not cfg.review_cache:
+        return await coro_factory()
+
+    key = cache_key(cfg.llm_model, prompt)
+    path = cache_path(cfg.workspace_dir / CACHE_DIR_NAME, key)
+    lock = _locks.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        _locks[key] = lock
+
+    async with lock:
+        try:
+            cached = await asyncio.to_thread(_read_cached, path)
+        except OSError as e:
+            logger.warning("Could not read LLM cache entry %s: %s", path, e)
+            cached = None
+        if cached is not None:
+            logger.debug("LLM cache hit: key=%s", key)
+            return cached
+
+        response = await coro_factory()
+        if response:
+            try:
+                await asyncio.to_thread(_write_cached, path, response)
+            except OSError as e:
+                logger.warning("Could not write LLM cache entry %s: %s", path, e)
+        return response
@@ -2,10 +2,11 @@
 Prompt text and assembly for the Code Review MCP server.
 
 Single responsibility: system prompt constant, depth instructions, and building
-the full user prompt (whole-file and section-based).
+the LLM input (whole-file prompt string and section-based chat messages).
 """
 
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Optional
 
 
@@ -60,7 +61,10 @@ Be specific, explain your reasoning, and provide actionable suggestions. Always
 """
 
 
-SECTION_REVIEW_PROMPT = """You are an expert code reviewer. You are reviewing ONE SECTION of a larger file.
+# Section review prompts are split into a system prefix that is byte-identical for
+# every section (and follow-up) of one file, so providers can cache it, and a
+# per-section user message.
+SECTION_REVIEW_SYSTEM_PROMPT = """You are an expert code reviewer. You are reviewing ONE SECTION at a time of a larger file.
 
 {priorities}
 
@@ -68,17 +72,10 @@ FILE: {file_path}
 
 {section_map}
 
-CURRENT SECTION: {section_kind} "{section_name}" (lines {section_start}-{section_end})
-
 {depth_instruction}
 
 {focus_instruction}
 
-SECTION CONTENT:
-```
-{section_content}
-```
-
 **CONTEXT REQUEST CAPABILITY:**
 If you need to see the full content of another section for context (e.g., a function called 
 by this one, or a class this inherits from), output exactly ONE line:
@@ -103,11 +100,16 @@ Be specific and actionable. Always check and comment on CODE STANDARDS violation
 """
 
 
-SECTION_CONTEXT_FOLLOWUP_PROMPT = """You are continuing your review of a section with additional context.
+SECTION_BATCH_REVIEW_USER_PROMPT = """You are reviewing {count} sections of this file in one response.
 
-{priorities}
+Start the review of each section with a line containing only "### SECTION <index>" (index as numbered below), 
+followed by that section's [LINE X] comments and, if needed, its REQUEST_CONTEXT line. 
+Include a header for every section, even when you have no comments for it.
+
+{sections}"""
 
-FILE: {file_path}
+
+SECTION_CONTEXT_FOLLOWUP_USER_PROMPT = """You are continuing your review of a section with additional context.
 
 CURRENT SECTION: {section_kind} "{section_name}" (lines {section_start}-{section_end})
 
@@ -133,6 +135,57 @@ Focus on the priorities and CODE STANDARDS above and how this context affects yo
 """
 
 
+# Depth instructions for the whole-file prompt and the section system prompt;
+# unknown depths fall back to "standard".
+_WHOLE_DEPTH_INSTRUCTIONS = MappingProxyType(
+    {
+        "quick": "Perform a quick scan focusing on obvious issues and critical problems.",
+        "standard": "Perform a comprehensive review covering all priority areas.",
+        "thorough": "Perform an in-depth analysis with detailed explanations and examples.",
+    }
+)
+_STANDARD_WHOLE = _WHOLE_DEPTH_INSTRUCTIONS["standard"]
+_SECTION_DEPTH_INSTRUCTIONS = MappingProxyType(
+    {
+        "quick": "Perform a quick scan focusing on obvious issues.",
+        "standard": "Perform a comprehensive review.",
+        "thorough": "Perform an in-depth analysis with detailed explanations.",
+    }
+)
+_STANDARD_SECTION = _SECTION_DEPTH_INSTRUCTIONS["standard"]
+
+
+# Templates with the constant REVIEW_PRIORITIES block substituted once at import,
+# so each build only formats the per-call fields (the block contains no braces).
+_CODE_REVIEW_PROMPT_PRE = CODE_REVIEW_PROMPT.replace("{priorities}", REVIEW_PRIORITIES)
+_SECTION_REVIEW_SYSTEM_PROMPT_PRE = SECTION_REVIEW_SYSTEM_PROMPT.replace(
+    "{priorities}", REVIEW_PRIORITIES
+)
+
+
+def _cached_system_message(text: str) -> dict[str, Any]:
+    """System message marked for provider prompt caching (ignored where unsupported)."""
+    return {
+        "role": "system",
+        "content": [
+            {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+        ],
+    }
+
+
+def _section_user_prompt(section_context: dict[str, Any]) -> str:
+    """Render one section's user message (built per section, so an f-string, not a template)."""
+    return (
+        f'CURRENT SECTION: {section_context["section_kind"]} "{section_context["section_name"]}" '
+        f'(lines {section_context["section_start_line"]}-{section_context["section_end_line"]})\n'
+        "\n"
+        "SECTION CONTENT:\n"
+        "```\n"
+        f'{section_context["section_text"]}\n'
+        "```\n"
+    )
+
+
 def build_review_prompt(
     file_path: Path,
     numbered_content: str,
@@ -150,23 +203,14 @@ def build_review_prompt(
     Returns:
         Complete prompt string to send to the LLM.
     """
-    depth_instructions = {
-        "quick": "Perform a quick scan focusing on obvious issues and critical problems.",
-        "standard": "Perform a comprehensive review covering all priority areas.",
-        "thorough": "Perform an in-depth analysis with detailed explanations and examples.",
-    }
-
-    depth_instruction = depth_instructions.get(
-        review_depth, depth_instructions["standard"]
-    )
+    depth_instruction = _WHOLE_DEPTH_INSTRUCTIONS.get(review_depth, _STANDARD_WHOLE)
     focus_instruction = (
         f"**SPECIAL FOCUS**: Pay particular attention to: {focus_areas}"
         if focus_areas
         else ""
     )
 
-    return CODE_REVIEW_PROMPT.format(
-        priorities=REVIEW_PRIORITIES,
+    return _CODE_REVIEW_PROMPT_PRE.format(
         file_path=str(file_path),
         depth_instruction=depth_instruction,
         focus_instruction=focus_instruction,
@@ -174,68 +218,122 @@ def build_review_prompt(
     )
 
 
-def build_section_review_prompt(
+def build_section_system_prompt(
     file_path: Path,
-    section_context: dict[str, Any],
+    section_map: str,
     review_depth: str,
     focus_areas: Optional[str],
 ) -> str:
-    """Build prompt for reviewing a single section with section map context.
+    """Build the stable system prefix shared by all section and follow-up prompts of a file.
 
     Args:
         file_path: Path to the file being reviewed.
-        section_context: Dict with section_map, section_kind, section_name,
-            section_start_line, section_end_line, section_text.
+        section_map: Section map text for the file.
         review_depth: One of 'quick', 'standard', 'thorough'.
         focus_areas: Optional string of areas to focus on, or None.
 
     Returns:
-        Complete prompt string for section review.
+        System prompt text (identical for every section of the file).
     """
-    depth_instructions = {
-        "quick": "Perform a quick scan focusing on obvious issues.",
-        "standard": "Perform a comprehensive review.",
-        "thorough": "Perform an in-depth analysis with detailed explanations.",
-    }
-
-    depth_instruction = depth_instructions.get(
-        review_depth, depth_instructions["standard"]
-    )
+    depth_instruction = _SECTION_DEPTH_INSTRUCTIONS.get(review_depth, _STANDARD_SECTION)
     focus_instruction = f"**SPECIAL FOCUS**: {focus_areas}" if focus_areas else ""
 
-    return SECTION_REVIEW_PROMPT.format(
-        priorities=REVIEW_PRIORITIES,
+    return _SECTION_REVIEW_SYSTEM_PROMPT_PRE.format(
         file_path=str(file_path),
-        section_map=section_context["section_map"],
-        section_kind=section_context["section_kind"],
-        section_name=section_context["section_name"],
-        section_start=section_context["section_start_line"],
-        section_end=section_context["section_end_line"],
-        section_content=section_context["section_text"],
+        section_map=section_map,
         depth_instruction=depth_instruction,
         focus_instruction=focus_instruction,
     )
 
 
+def build_section_review_prompt(
+    file_path: Path,
+    section_context: dict[str, Any],
+    review_depth: str,
+    focus_areas: Optional[str],
+) -> list[dict[str, Any]]:
+    """Build chat messages for reviewing a single section with section map context.
+
+    Args:
+        file_path: Path to the file being reviewed.
+        section_context: Dict with section_map, section_kind, section_name,
+            section_start_line, section_end_line, section_text.
+        review_depth: One of 'quick', 'standard', 'thorough'.
+        focus_areas: Optional string of areas to focus on, or None.
+
+    Returns:
+        Messages list: cacheable system prefix plus the section-specific user message.
+    """
+    system_prompt = build_section_system_prompt(
+        file_path, section_context["section_map"], review_depth, focus_areas
+    )
+    return [
+        _cached_system_message(system_prompt),
+        {"role": "user", "content": _section_user_prompt(section_context)},
+    ]
+
+
+def build_section_batch_review_prompt(
+    file_path: Path,
+    section_contexts: list[dict[str, Any]],
+    review_depth: str,
+    focus_areas: Optional[str],
+) -> list[dict[str, Any]]:
+    """Build chat messages for reviewing several sections of one file in a single call.
+
+    Args:
+        file_path: Path to the file being reviewed.
+        section_contexts: Section context dicts (see build_section_review_prompt);
+            all share the same section_map.
+        review_depth: One of 'quick', 'standard', 'thorough'.
+        focus_areas: Optional string of areas to focus on, or None.
+
+    Returns:
+        Messages list: cacheable system prefix plus one user message listing the
+        sections under "### SECTION <index>" headers (1-based).
+    """
+    system_prompt = build_section_system_prompt(
+        file_path, section_contexts[0]["section_map"], review_depth, focus_areas
+    )
+    sections = "\n".join(
+        f"### SECTION {index}\n{_section_user_prompt(ctx)}"
+        for index, ctx in enumerate(section_contexts, start=1)
+    )
+    user_prompt = SECTION_BATCH_REVIEW_USER_PROMPT.format(
+        count=len(section_contexts), sections=sections
+    )
+    return [
+        _cached_system_message(system_prompt),
+        {"role": "user", "content": user_prompt},
+    ]
+
+
 def build_section_context_followup_prompt(
     file_path: Path,
     section_context: dict[str, Any],
     context_section_text: str,
-) -> str:
-    """Build prompt for follow-up review after context request.
+    review_depth: str,
+    focus_areas: Optional[str],
+) -> list[dict[str, Any]]:
+    """Build chat messages for follow-up review after context request.
+
+    Reuses the same system prefix as the section prompts so it hits the provider cache.
 
     Args:
         file_path: Path to the file being reviewed.
-        section_context: Dict with section_kind, section_name, section_start_line,
-            section_end_line, section_text.
+        section_context: Dict with section_map, section_kind, section_name,
+            section_start_line, section_end_line, section_text.
         context_section_text: Text of the requested context section (with line numbers).
+        review_depth: One of 'quick', 'standard', 'thorough'.
+        focus_areas: Optional string of areas to focus on, or None.
 
     Returns:
-        Complete prompt string for follow-up review.
+        Messages list: cacheable system prefix plus the follow-up user message.
     """
-    return SECTION_CONTEXT_FOLLOWUP_PROMPT.format(
-        priorities=REVIEW_PRIORITIES,
-        file_path=str(file_path),
+    system_prompt = build_section_system_prompt(
+        file_path, section_context["section_map"], review_depth, focus_areas
+    )
+    user_prompt = SECTION_CONTEXT_FOLLOWUP_USER_PROMPT.format(
         section_kind=section_context["section_kind"],
         section_name=section_context["section_name"],
         section_start=section_context["section_start_line"],
@@ -243,3 +341,7 @@ def build_section_context_followup_prompt(
         section_content=section_context["section_text"],
         context_section_content=context_section_text,
     )
+    return [
+        _cached_system_message(system_prompt),
+        {"role": "user", "content": user_prompt},
+    ]
@@ -0,0 +1,95 @@
+"""
+Client-side rate limiting for LLM calls.
+
+Single responsibility: token-bucket governor (requests/tokens per minute) and
+retry-with-exponential-backoff for transient provider errors.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """Async token bucket: refills at `rate` tokens/second up to `capacity`.
+
+    Waiters are served in FIFO order; a request larger than the capacity is
+    clamped to it so it can still proceed once the bucket is full.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize a full bucket."""
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """Wait until `tokens` are available, then consume them."""
+        tokens = min(tokens, self.capacity)
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= tokens
+
+
+def per_minute_bucket(limit: int) -> TokenBucket | None:
+    """Bucket allowing `limit` units per minute (bursting up to `limit`), or None if limit is 0."""
+    if limit <= 0:
+        return None
+    return TokenBucket(rate=limit / 60.0, capacity=float(limit))
+
+
+async def retry_with_backoff(
+    coro_factory: Callable[[], Awaitable[T]],
+    retry_on: tuple[type[BaseException], ...],
+    retries: int,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+) -> T:
+    """Await coro_factory(), retrying on `retry_on` errors with jittered exponential backoff.
+
+    Args:
+        coro_factory: Zero-arg callable returning a fresh awaitable per attempt.
+        retry_on: Exception types considered transient (e.g. 429 / 5xx errors).
+        retries: Number of retries after the first attempt (0 disables retrying).
+        base_delay: Delay before the first retry, in seconds; doubles each retry.
+        max_delay: Upper bound for a single delay, in seconds.
+
+    Returns:
+        Result of the first successful attempt; the last error is re-raised.
+    """
+    attempt = 0
+    while True:
+        try:
+            return await coro_factory()
+        except retry_on as e:
+            if attempt >= retries:
+                raise
+            delay = min(max_delay, base_delay * 2**attempt) * random.uniform(0.5, 1.0)
+            attempt += 1
+            logger.warning(
+                "Transient LLM error (%s); retry %s/%s in %.1fs",
+                type(e).__name__,
+                attempt,
+                retries,
+                delay,
+            )
+            await asyncio.sleep(delay)
@@ -6,6 +6,7 @@ Handles split decision, section iteration, and context requests.
 
 from pathlib import Path
 from typing import List, Optional
+import ast
 import re
 
 from sections import Section, build_section_map, parse_sections
@@ -14,6 +15,19 @@ from sections import Section, build_section_map, parse_sections
 # Configuration constants
 SPLIT_THRESHOLD_LINES = 150  # Files below this use whole-file review
 EXTRA_ITERATIONS = 4  # Budget for context requests; when max reached, section loop stops (no error).
+TRIVIAL_IMPORT_LINES = 5  # Import sections shorter than this are not sent for review.
+
+# "lines 12-18" / "lines  12 - 18" style section identifier.
+_LINES_RANGE_RE = re.compile(r"lines\s*(\d+)\s*-\s*(\d+)")
+
+# "REQUEST_CONTEXT: <identifier>" line asking for another section's code.
+# The identifier runs to the end of its line.
+_CONTEXT_REQUEST_RE = re.compile(r"REQUEST_CONTEXT:\s*([^\n]+)", re.IGNORECASE)
+
+# "### SECTION <index>" header delimiting per-section blocks in a batched review response.
+_BATCH_SECTION_HEADER_RE = re.compile(
+    r"^[ \t]*#{2,3}[ \t]*SECTION[ \t]+(\d+)[ \t]*$", re.MULTILINE | re.IGNORECASE
+)
 
 
 class ReviewOrchestrator:
@@ -21,16 +35,40 @@ class ReviewOrchestrator:
 
     def __init__(self) -> None:
         """Initialize orchestrator state."""
-        self.sections: List[Section] = []
-        self.section_map: str = ""
+        self._sections: List[Section] = []
+        # Derived from self.sections on first use; reset whenever sections are replaced.
+        self._section_map: Optional[str] = None
+        self._section_index: Optional[dict[str, Section]] = None
         # Accumulated [LINE N] TYPE: comment lines from section reviews (used by agent).
         self.accumulated_reviews: List[str] = []
         self.iterations_used: int = 0
         self.max_iterations: int = 0
 
+    @property
+    def sections(self) -> List[Section]:
+        """Sections of the file being reviewed."""
+        return self._sections
+
+    @sections.setter
+    def sections(self, sections: List[Section]) -> None:
+        self._sections = sections
+        self._section_map = None
+        self._section_index = None
+
+    @property
+    def section_map(self) -> str:
+        """Section map text for the prepared sections (empty before prepare_sections)."""
+        if self._section_map is None:
+            self._section_map = build_section_map(self.sections) if self.sections else ""
+        return self._section_map
+
     def should_split(self, content: str, file_path: Path) -> bool:
         """Decide whether to split file into sections or use whole-file review."""
-        line_count = len(content.splitlines())
+        # Every "\n" ends a distinct line, so the count is a lower bound on
+        # len(content.splitlines()); only short files need the exact count.
+        line_count = content.count("\n")
+        if line_count < SPLIT_THRESHOLD_LINES:
+            line_count = len(content.splitlines())
 
         if line_count < SPLIT_THRESHOLD_LINES:
             return False
@@ -51,11 +89,23 @@ class ReviewOrchestrator:
     def prepare_sections(self, content: str, file_path: Path) -> None:
         """Parse file into sections and build section map."""
         self.sections = parse_sections(content, file_path)
-        self.section_map = build_section_map(self.sections)
         self.max_iterations = len(self.sections) + EXTRA_ITERATIONS
         self.iterations_used = 0
         self.accumulated_reviews = []
 
+    def should_review(self, section: Section, file_path: Path) -> bool:
+        """Decide whether a section is worth its own LLM review.
+
+        Short import blocks and Python globals made only of literal assignments
+        rarely draw comments, so they are skipped. Skipped sections stay in the
+        section map and can still be requested as context.
+        """
+        if section.kind == "imports":
+            return len(section.text.splitlines()) >= TRIVIAL_IMPORT_LINES
+        if section.kind == "globals" and file_path.suffix.lower() in (".py", ".pyw"):
+            return not _is_literal_assignments(section.text)
+        return True
+
     def resolve_section_identifier(self, identifier: str) -> Optional[Section]:
         """Resolve a section identifier to a Section object.
 
@@ -67,21 +117,36 @@ class ReviewOrchestrator:
         """
         identifier = identifier.strip().lower()
         # Normalize "lines 12-18" / "lines  12-18" / "lines 12 - 18" style
-        lines_match = re.search(r"lines\s*(\d+)\s*-\s*(\d+)", identifier)
+        lines_match = _LINES_RANGE_RE.search(identifier)
         if lines_match:
             identifier = f"lines {lines_match.group(1)}-{lines_match.group(2)}"
 
-        for section in self.sections:
-            if f"{section.kind} {section.name}".lower() == identifier:
-                return section
+        if self._section_index is None:
+            # Every accepted form maps to the first section (in file order) that has it.
+            index: dict[str, Section] = {}
+            for section in self.sections:
+                index.setdefault(f"{section.kind} {section.name}".lower(), section)
+                index.setdefault(section.name.lower(), section)
+                index.setdefault(f"lines {section.start_line}-{section.end_line}", section)
+            self._section_index = index
+        return self._section_index.get(identifier)
 
-            if section.name.lower() == identifier:
-                return section
+    def parse_response(self, review_text: str) -> tuple[List[str], Optional[str]]:
+        """Extract both [LINE X] comments and the REQUEST_CONTEXT identifier.
 
-            if f"lines {section.start_line}-{section.end_line}" == identifier:
-                return section
+        Lines are walked once for comments; the context request is located with
+        a single precompiled regex search (no match in the common case).
 
-        return None
+        Returns:
+            (comment lines, section identifier or None).
+        """
+        comments = [
+            stripped
+            for stripped in map(str.strip, review_text.splitlines())
+            if stripped.startswith("[LINE ")
+        ]
+        match = _CONTEXT_REQUEST_RE.search(review_text)
+        return comments, match.group(1).strip() if match else None
 
     def parse_context_request(self, review_text: str) -> Optional[str]:
         """Extract REQUEST_CONTEXT identifier from LLM response.
@@ -89,21 +154,36 @@ class ReviewOrchestrator:
         Returns:
             Section identifier if found, None otherwise.
         """
-        match = re.search(
-            r"REQUEST_CONTEXT:\s*(.+?)(?:\n|$)", review_text, re.IGNORECASE
-        )
-        if match:
-            return match.group(1).strip()
-        return None
+        return self.parse_response(review_text)[1]
 
     def parse_review_comments(self, review_text: str) -> List[str]:
         """Extract [LINE X] comment lines from review text."""
-        comments = []
-        for line in review_text.strip().splitlines():
-            stripped = line.strip()
-            if stripped.startswith("[LINE "):
-                comments.append(stripped)
-        return comments
+        return self.parse_response(review_text)[0]
+
+    def split_batch_response(self, review_text: str, num_sections: int) -> dict[int, str]:
+        """Split a batched review response into per-section blocks.
+
+        Args:
+            review_text: LLM response using "### SECTION <index>" headers (1-based).
+            num_sections: Number of sections in the batch.
+
+        Returns:
+            Mapping of 0-based position in the batch to that section's response text.
+            Sections whose header is missing are absent from the mapping.
+        """
+        blocks: dict[int, str] = {}
+        headers = list(_BATCH_SECTION_HEADER_RE.finditer(review_text))
+        for n, header in enumerate(headers):
+            position = int(header.group(1)) - 1
+            if not 0 <= position < num_sections:
+                continue
+            end = headers[n + 1].start() if n + 1 < len(headers) else len(review_text)
+            block = review_text[header.end() : end].strip()
+            if position in blocks:
+                blocks[position] = f"{blocks[position]}\n{block}"
+            else:
+                blocks[position] = block
+        return blocks
 
     def get_section_context_for_review(self, section: Section) -> dict[str, str | int]:
         """Build context dict for section review prompt."""
@@ -117,13 +197,25 @@ class ReviewOrchestrator:
         }
 
 
-def add_line_numbers_to_section(section: Section) -> str:
-    """Add line numbers to section text matching original file line numbers."""
-    section_lines = section.text.splitlines()
-    numbered_lines = []
+def _is_literal_assignments(source: str) -> bool:
+    """True if source parses as plain NAME = <literal> assignments only."""
+    try:
+        body = ast.parse(source).body
+    except SyntaxError:
+        return False
+    for node in body:
+        if not isinstance(node, (ast.Assign, ast.AnnAssign)) or node.value is None:
+            return False
+        try:
+            ast.literal_eval(node.value)
+        except ValueError:
+            return False
+    return bool(body)
 
-    for i, line in enumerate(section_lines):
-        actual_line_num = section.start_line + i
-        numbered_lines.append(f"{actual_line_num:4d} | {line}")
 
-    return "\n".join(numbered_lines)
+def add_line_numbers_to_section(section: Section) -> str:
+    """Add line numbers to section text matching original file line numbers."""
+    # Same C-level formatting as agent.add_line_numbers, offset to the section start.
+    return "\n".join(
+        map("%4d | %s".__mod__, enumerate(section.text.splitlines(), section.start_line))
+    )
@@ -4,42 +4,76 @@ Section parsing for code files.
 Splits files into logical sections (imports, globals, functions, classes) for review.
 """
 
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from itertools import accumulate
 from pathlib import Path
 from typing import List
 import re
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
-
-
-class Section(BaseModel):
-    """Represents a logical section of code."""
-
-    model_config = ConfigDict(frozen=True)
-
-    kind: str = Field(
-        ...,
-        description="One of: imports, globals, function, class, other",
-    )
-    name: str = Field(
-        ...,
-        description="Section name, e.g. parse_config, Handler, or imports",
-    )
-    start_line: int = Field(..., ge=1, description="First line number (1-based).")
-    end_line: int = Field(..., ge=1, description="Last line number (1-based).")
-    text: str = Field(..., description="Section content.")
-
-    @model_validator(mode="after")
-    def end_line_not_before_start(self) -> "Section":
+# Line patterns, compiled once; matched against every line of a parsed file.
+# Python: keyword prefixes of def/class lines; checked with str.startswith before
+# running a pattern, since almost no line starts with one.
+_PY_BLOCK_PREFIXES = ("def", "async", "class")
+# Python: any def/class keyword line (ends the globals scan).
+_PY_DEF_OR_CLASS_RE = re.compile(r"^(?:async\s+)?(?:def|class)\s+\w+")
+# Python: top-level def / async def (group 1) or class (group 2) with its name.
+_PY_BLOCK_RE = re.compile(
+    r"^(?:(?:async\s+)?def\s+([A-Za-z_][A-Za-z0-9_]*)\s*\(|class\s+([A-Za-z_][A-Za-z0-9_]*))"
+)
+# Python: newline followed by a non-blank column-0 line, i.e. the end of a top-level
+# block. Searched over the whole content so the indentation scan runs in C.
+_PY_DEDENT_RE = re.compile(r"\n(?=\S)")
+# Python: top-level assignment (column 0).
+_PY_GLOBAL_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*\s*=")
+# JS/TS: import / require line.
+_JS_IMPORT_RE = re.compile(r'^import\s+.*from|^import\s+["\']|^const.*=\s*require\(')
+# JS/TS: function / class keyword line (ends the globals scan).
+_JS_FUNC_OR_CLASS_RE = re.compile(r"^(?:function|class)\s+\w+")
+# JS/TS: const/let/var declaration.
+_JS_DECL_RE = re.compile(r"^(?:const|let|var)\s+\w+")
+# JS/TS: function / async function declaration with its name.
+_JS_FUNC_RE = re.compile(r"^(?:async\s+)?function\s+([A-Za-z_$][A-Za-z0-9_$]*)\s*\(")
+# JS/TS: arrow function bound to a const/let/var, with its name.
+_JS_ARROW_RE = re.compile(
+    r"^(?:const|let|var)\s+([A-Za-z_$][A-Za-z0-9_$]*)\s*=\s*(?:async\s*)?\(.*\)\s*=>"
+)
+# JS/TS: class declaration with its name.
+_JS_CLASS_RE = re.compile(r"^class\s+([A-Za-z_$][A-Za-z0-9_$]*)")
+# JS/TS: closing line of a multi-line decorator (e.g. "})").
+_JS_DECORATOR_CLOSE_RE = re.compile(r"^[\]})\s,;]+$")
+
+
+@dataclass(frozen=True, slots=True)
+class Section:
+    """Represents a logical section of code.
+
+    A plain frozen dataclass rather than a pydantic model: sections are created
+    per parsed block and only need the line-range check in __post_init__.
+    """
+
+    # One of: imports, globals, function, class, other
+    kind: str
+    # Section name, e.g. parse_config, Handler, or imports
+    name: str
+    # First and last line numbers (1-based, inclusive)
+    start_line: int
+    end_line: int
+    # Section content
+    text: str
+    # Unique identifier for this section (for context requests); set in __post_init__.
+    identifier: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.start_line < 1 or self.end_line < 1:
+            raise ValueError("start_line and end_line must be >= 1")
         if self.end_line < self.start_line:
             raise ValueError("end_line must be >= start_line")
-        return self
-
-    @property
-    def identifier(self) -> str:
-        """Unique identifier for this section (for context requests)."""
         if self.kind in ("imports", "globals", "other"):
-            return f"{self.kind}: lines {self.start_line}-{self.end_line}"
-        return f"{self.kind} {self.name}: lines {self.start_line}-{self.end_line}"
+            identifier = f"{self.kind}: lines {self.start_line}-{self.end_line}"
+        else:
+            identifier = f"{self.kind} {self.name}: lines {self.start_line}-{self.end_line}"
+        object.__setattr__(self, "identifier", identifier)
 
 
 class SectionParser:
@@ -55,6 +89,23 @@ class SectionParser:
         self.lines = content.splitlines()
         self.file_path = file_path
         self.ext = file_path.suffix.lower()
+        # Start offset of each line in content, so section text is one slice of
+        # content instead of a re-join of its lines. Only valid when every line
+        # ends in a bare "\n" (what read_file_content produces); otherwise None.
+        self._line_starts: list[int] | None = None
+        if "\r" not in content and len(self.lines) == content.count("\n") + (
+            not content.endswith("\n")
+        ):
+            # Prefix sum of (line length + 1), built from C-level map/accumulate.
+            self._line_starts = list(
+                accumulate(map((1).__add__, map(len, self.lines)), initial=0)
+            )
+
+    def _text(self, start_idx: int, end_idx: int) -> str:
+        """Text of lines[start_idx:end_idx] joined by newlines (0-based, end exclusive)."""
+        if self._line_starts is None or start_idx >= end_idx:
+            return "\n".join(self.lines[start_idx:end_idx])
+        return self.content[self._line_starts[start_idx] : self._line_starts[end_idx] - 1]
 
     def parse(self) -> List[Section]:
         """Parse file into sections based on language."""
@@ -122,7 +173,7 @@ class SectionParser:
                     name="imports",
                     start_line=import_start,
                     end_line=import_end,
-                    text="\n".join(self.lines[import_start - 1 : import_end]),
+                    text=self._text(import_start - 1, import_end),
                 )
             )
 
@@ -135,13 +186,14 @@ class SectionParser:
             if not stripped or stripped.startswith("#"):
                 continue
 
-            if stripped.startswith("@") or re.match(
-                r"^(async\s+)?(def|class)\s+\w+", stripped
+            if stripped.startswith("@") or (
+                stripped.startswith(_PY_BLOCK_PREFIXES)
+                and _PY_DEF_OR_CLASS_RE.match(stripped)
             ):
                 break
 
             # Top-level globals only (column 0)
-            if re.match(r"^[A-Za-z_][A-Za-z0-9_]*\s*=", line):
+            if _PY_GLOBAL_RE.match(line):
                 if globals_start is None:
                     globals_start = i + 1
                 globals_end = i + 1
@@ -153,56 +205,37 @@ class SectionParser:
                     name="globals",
                     start_line=globals_start,
                     end_line=globals_end,
-                    text="\n".join(self.lines[globals_start - 1 : globals_end]),
+                    text=self._text(globals_start - 1, globals_end),
                 )
             )
 
         # 3. Find functions and classes (with decorators)
+        lines = self.lines
         i = max(import_end, globals_end)
-        while i < len(self.lines):
-            line = self.lines[i]
-            stripped = line.lstrip()
-
-            func_match = re.match(r"^def\s+([A-Za-z_][A-Za-z0-9_]*)\s*\(", line)
-            async_func_match = re.match(
-                r"^async\s+def\s+([A-Za-z_][A-Za-z0-9_]*)\s*\(", line
+        while i < len(lines):
+            line = lines[i]
+            # Top-level blocks start at column 0 with a keyword; other lines skip the regex.
+            block_match = (
+                _PY_BLOCK_RE.match(line) if line.startswith(_PY_BLOCK_PREFIXES) else None
             )
-            if func_match or async_func_match:
-                func_name = (func_match or async_func_match).group(1)
-                decorator_start_idx = self._find_decorators_start(i)
-                start = decorator_start_idx + 1
-                end = self._find_block_end(i)
-                sections.append(
-                    Section(
-                        kind="function",
-                        name=func_name,
-                        start_line=start,
-                        end_line=end,
-                        text="\n".join(self.lines[decorator_start_idx:end]),
-                    )
-                )
-                i = end
+            if block_match is None:
+                i += 1
                 continue
 
-            class_match = re.match(r"^class\s+([A-Za-z_][A-Za-z0-9_]*)", line)
-            if class_match:
-                class_name = class_match.group(1)
-                decorator_start_idx = self._find_decorators_start(i)
-                start = decorator_start_idx + 1
-                end = self._find_block_end(i)
-                sections.append(
-                    Section(
-                        kind="class",
-                        name=class_name,
-                        start_line=start,
-                        end_line=end,
-                        text="\n".join(self.lines[decorator_start_idx:end]),
-                    )
+            func_name, class_name = block_match.groups()
+            decorator_start_idx = self._find_decorators_start(i)
+            start = decorator_start_idx + 1
+            end = self._find_block_end(i)
+            sections.append(
+                Section(
+                    kind="function" if func_name is not None else "class",
+                    name=func_name if func_name is not None else class_name,
+                    start_line=start,
+                    end_line=end,
+                    text=self._text(decorator_start_idx, end),
                 )
-                i = end
-                continue
-
-            i += 1
+            )
+            i = end
 
         if sections:
             return sections
@@ -256,7 +289,7 @@ class SectionParser:
                 i -= 1
                 continue
             # Multi-line decorator: closing line (e.g. "})") or indented content
-            if re.match(r"^[\]})\s,;]+$", stripped):
+            if _JS_DECORATOR_CLOSE_RE.match(stripped):
                 decorator_start = i
                 i -= 1
                 continue
@@ -275,10 +308,7 @@ class SectionParser:
         import_end = 0
         for i, line in enumerate(self.lines, 1):
             stripped = line.strip()
-            if re.match(
-                r'^import\s+.*from|^import\s+["\']|^const.*=\s*require\(',
-                stripped,
-            ):
+            if _JS_IMPORT_RE.match(stripped):
                 if import_start is None:
                     import_start = i
                 import_end = i
@@ -294,15 +324,12 @@ class SectionParser:
                     name="imports",
                     start_line=import_start,
                     end_line=import_end,
-                    text="\n".join(self.lines[import_start - 1 : import_end]),
+                    text=self._text(import_start - 1, import_end),
                 )
             )
 
         globals_start = None
         globals_end = 0
-        arrow_pattern = re.compile(
-            r"^(?:const|let|var)\s+[A-Za-z_$][A-Za-z0-9_$]*\s*=\s*(?:async\s*)?\(.*\)\s*=>"
-        )
         for i in range(import_end, len(self.lines)):
             line = self.lines[i]
             stripped = line.strip()
@@ -310,15 +337,13 @@ class SectionParser:
             if not stripped or stripped.startswith("//") or stripped.startswith("/*"):
                 continue
 
-            if stripped.startswith("@") or re.match(
-                r"^(function|class)\s+\w+", stripped
-            ):
+            if stripped.startswith("@") or _JS_FUNC_OR_CLASS_RE.match(stripped):
                 break
 
-            if arrow_pattern.match(stripped):
+            if _JS_ARROW_RE.match(stripped):
                 continue
 
-            if re.match(r"^(const|let|var)\s+\w+", stripped):
+            if _JS_DECL_RE.match(stripped):
                 if globals_start is None:
                     globals_start = i + 1
                 globals_end = i + 1
@@ -330,7 +355,7 @@ class SectionParser:
                     name="globals",
                     start_line=globals_start,
                     end_line=globals_end,
-                    text="\n".join(self.lines[globals_start - 1 : globals_end]),
+                    text=self._text(globals_start - 1, globals_end),
                 )
             )
 
@@ -339,19 +364,9 @@ class SectionParser:
             line = self.lines[i]
             stripped = line.strip()
 
-            func_match = re.match(
-                r"^function\s+([A-Za-z_$][A-Za-z0-9_$]*)\s*\(", stripped
-            )
-            async_match = re.match(
-                r"^async\s+function\s+([A-Za-z_$][A-Za-z0-9_$]*)\s*\(", stripped
-            )
-            arrow_match = re.match(
-                r"^(?:const|let|var)\s+([A-Za-z_$][A-Za-z0-9_$]*)\s*=\s*(?:async\s*)?\(.*\)\s*=>",
-                stripped,
-            )
-
-            if func_match or arrow_match or async_match:
-                func_name = (func_match or arrow_match or async_match).group(1)
+            func_match = _JS_FUNC_RE.match(stripped) or _JS_ARROW_RE.match(stripped)
+            if func_match:
+                func_name = func_match.group(1)
                 decorator_start_idx = self._find_js_decorators_start(i)
                 start = decorator_start_idx + 1
                 end = self._find_js_block_end(i)
@@ -361,13 +376,13 @@ class SectionParser:
                         name=func_name,
                         start_line=start,
                         end_line=end,
-                        text="\n".join(self.lines[decorator_start_idx:end]),
+                        text=self._text(decorator_start_idx, end),
                     )
                 )
                 i = end
                 continue
 
-            class_match = re.match(r"^class\s+([A-Za-z_$][A-Za-z0-9_$]*)", stripped)
+            class_match = _JS_CLASS_RE.match(stripped)
             if class_match:
                 class_name = class_match.group(1)
                 decorator_start_idx = self._find_js_decorators_start(i)
@@ -379,7 +394,7 @@ class SectionParser:
                         name=class_name,
                         start_line=start,
                         end_line=end,
-                        text="\n".join(self.lines[decorator_start_idx:end]),
+                        text=self._text(decorator_start_idx, end),
                     )
                 )
                 i = end
@@ -405,14 +420,21 @@ class SectionParser:
             return len(self.lines)
 
         base_indent = len(self.lines[start_idx]) - len(self.lines[start_idx].lstrip())
-
+        if base_indent == 0 and self._line_starts is not None:
+            # First later line that starts with non-whitespace; blank lines never match.
+            match = _PY_DEDENT_RE.search(self.content, self._line_starts[start_idx + 1] - 1)
+            if match is None:
+                return len(self.lines)
+            return bisect_left(self._line_starts, match.end())
+
+        # A line stays in the block if it is blank or indented past the header;
+        # testing only its first base_indent + 1 characters avoids an lstrip copy.
+        width = base_indent + 1
         for i in range(start_idx + 1, len(self.lines)):
             line = self.lines[i]
-            if not line.strip():
+            if not line or line[:width].isspace():
                 continue
-            current_indent = len(line) - len(line.lstrip())
-            if current_indent <= base_indent:
-                return i
+            return i
 
         return len(self.lines)
 
@@ -426,6 +448,15 @@ class SectionParser:
 
         for i in range(start_idx, len(self.lines)):
             line = self.lines[i]
+            opens = line.count("{")
+            closes = line.count("}")
+            if not opens and not closes:
+                continue
+            if started and brace_count - closes > 0:
+                # The count cannot reach zero on this line: update it in bulk.
+                brace_count += opens - closes
+                continue
+            # The block may close on this line: walk it to find where.
             for char in line:
                 if char == "{":
                     brace_count += 1
@@ -1,6 +1,13 @@
 """Shared utilities for the Code Review MCP server."""
 
-from utils.path_utils import resolve_file_in_workspace
+from utils.path_utils import (
+    git_list_files_in_dir,
+    has_parent_segment,
+    list_files_in_dir,
+    resolve_cache_clear,
+    resolve_file_in_workspace,
+    safe_resolve,
+)
 from utils.params import (
     REVIEW_CODE_FILE_USAGE,
     parse_review_params,
@@ -9,7 +16,12 @@ from utils.params import (
 
 __all__ = [
     "REVIEW_CODE_FILE_USAGE",
+    "git_list_files_in_dir",
+    "has_parent_segment",
+    "list_files_in_dir",
     "parse_review_params",
+    "resolve_cache_clear",
     "resolve_file_in_workspace",
+    "safe_resolve",
     "salvage_params_from_string",
 ]
@@ -1,10 +1,25 @@
 """Review tool parameter parsing and salvage from malformed client input."""
 
+import functools
 import json
 import re
 from typing import Any
 
+try:  # Optional C JSON parser; the stdlib parser is used when it is not installed.
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+from pydantic import TypeAdapter
+
 from agent import ReviewFileInput
+from utils.path_utils import has_parent_segment
+
+# Module-level adapter: reuses one core validator and skips the
+# model_validate classmethod wrapper on every tool call.
+_REVIEW_INPUT_ADAPTER = TypeAdapter(ReviewFileInput)
 
 # Instructional error text so the calling AI agent can fix the next tool call.
 REVIEW_CODE_FILE_USAGE = """
@@ -17,12 +32,22 @@ Example: {"file_path": "src/app.py", "review_depth": "standard"}
 If your client sends tool arguments as a string, send the object structure instead so the server receives a dict.
 """
 
-# Patterns to salvage file_path from malformed strings.
-_FILE_PATH_PATTERNS = [
-    re.compile(r'''["']?file_path["']?\s*:\s*["']([^"']+)["']''', re.IGNORECASE),
-    re.compile(r'''["']?file_path["']?\s*:\s*([^\s,}'"]+)''', re.IGNORECASE),
-    re.compile(r'''(\b(?:src|backend|lib|app|tests)/[a-zA-Z0-9_./\-]+\.[a-zA-Z0-9]+)'''),
-]
+# Patterns to salvage file_path from malformed strings: a file_path key with a
+# quoted or bare value (one pass), else anything that looks like a source path.
+# re.ASCII keeps \b, \s and \w to ASCII semantics, skipping Unicode lookups.
+_FILE_PATH_KEY_RE = re.compile(
+    r'''["']?file_path["']?\s*:\s*(?:["'](?P<quoted>[^"']+)["']|(?P<bare>[^\s,}'"]+))''',
+    re.IGNORECASE | re.ASCII,
+)
+# Review depth mentioned anywhere in a malformed string; "thorough" wins over "quick".
+_DEPTH_RE = re.compile(r"thorough|quick", re.IGNORECASE | re.ASCII)
+_THOROUGH_RE = re.compile(r"thorough", re.IGNORECASE | re.ASCII)
+_PATH_LIKE_RE = re.compile(
+    r"(\b(?:src|backend|lib|app|tests)/[\w./\-]+\.[a-zA-Z0-9]+)", re.ASCII
+)
+
+# Error for empty tool calls; the tool response appends REVIEW_CODE_FILE_USAGE.
+_MISSING_PARAMS_MESSAGE = "Missing params: file_path is required."
 
 
 def salvage_params_from_string(s: str) -> dict[str, Any] | None:
@@ -31,24 +56,36 @@ def salvage_params_from_string(s: str) -> dict[str, Any] | None:
     Handles common LLM/client mistakes like {}'file_path: backend/...' or
     file_path: backend/database/models/feature.py.
     """
+    fields = _salvage_fields(s)
+    if fields is None:
+        return None
+    return {"file_path": fields[0], "review_depth": fields[1]}
+
+
+# Buggy clients tend to resend the identical malformed string on retry; the
+# cached result is an immutable tuple so callers always get a fresh dict.
+@functools.lru_cache(maxsize=128)
+def _salvage_fields(s: str) -> tuple[str, str] | None:
     s = s.strip()
     if not s:
         return None
     file_path: str | None = None
-    for pat in _FILE_PATH_PATTERNS:
-        m = pat.search(s)
+    m = _FILE_PATH_KEY_RE.search(s)
+    if m:
+        file_path = (m.group("quoted") or m.group("bare")).strip().strip("'\"")
+    if not file_path or "/" not in file_path or file_path.startswith("{"):
+        m = _PATH_LIKE_RE.search(s)
         if m:
             file_path = m.group(1).strip().strip("'\"")
-            if file_path and "/" in file_path and not file_path.startswith("{"):
-                break
-    if not file_path or ".." in file_path or file_path.startswith("/"):
+    if not file_path or has_parent_segment(file_path) or file_path.startswith("/"):
         return None
     review_depth = "standard"
-    if "thorough" in s.lower():
-        review_depth = "thorough"
-    elif "quick" in s.lower():
-        review_depth = "quick"
-    return {"file_path": file_path, "review_depth": review_depth}
+    m = _DEPTH_RE.search(s)
+    if m:
+        review_depth = m.group(0).lower()
+        if review_depth == "quick" and _THOROUGH_RE.search(s, m.end()):
+            review_depth = "thorough"
+    return file_path, review_depth
 
 
 def parse_review_params(raw: Any) -> ReviewFileInput:
@@ -61,18 +98,24 @@ def parse_review_params(raw: Any) -> ReviewFileInput:
     """
     if isinstance(raw, ReviewFileInput):
         return raw
+    # Empty tool calls are a common client bug; reject them before pydantic
+    # builds (and the server formats) a multi-error ValidationError.
+    if raw is None or (isinstance(raw, str) and not raw.strip()):
+        raise ValueError(_MISSING_PARAMS_MESSAGE)
     if isinstance(raw, str):
         try:
-            raw = json.loads(raw)
-        except json.JSONDecodeError as e:
+            raw = _json_loads(raw)
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
             salvaged = salvage_params_from_string(raw)
             if salvaged is not None:
-                return ReviewFileInput.model_validate(salvaged)
+                return _REVIEW_INPUT_ADAPTER.validate_python(salvaged)
             raise ValueError(
                 "Invalid params (expected JSON). Use exactly: {\"file_path\": \"path/to/file.py\", \"review_depth\": \"standard\"}"
             ) from e
     if isinstance(raw, dict):
-        return ReviewFileInput.model_validate(raw)
+        if not raw:
+            raise ValueError(_MISSING_PARAMS_MESSAGE)
+        return _REVIEW_INPUT_ADAPTER.validate_python(raw)
     raise ValueError(
         f"params must be a JSON object or string, got {type(raw).__name__}"
     )
@@ -1,12 +1,180 @@
 """Path and workspace file resolution utilities."""
 
+import asyncio
+import functools
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 # Directories to skip when searching workspace for a file by path suffix.
 WORKSPACE_SEARCH_IGNORE = frozenset(
-    {".git", "node_modules", "__pycache__", ".venv", "venv"}
+    {".git", "node_modules", "__pycache__", ".venv", "venv", ".review_cache"}
 )
 
+# A ".." path segment (either separator); names like "my..file.py" are fine.
+_PARENT_SEGMENT_RE = re.compile(r"(?:^|[/\\])\.\.(?:[/\\]|$)")
+
+# Suffix-search results keyed by (workspace_dir, normalized file_path), most recent
+# last. Only hits are cached, and each is re-checked with is_file() before use, so
+# new, moved or deleted files are never masked. Guarded by a lock because lookups
+# run in worker threads.
+_RESOLVE_CACHE_SIZE = 512
+_resolve_cache: "OrderedDict[tuple[str, str], Path]" = OrderedDict()
+_resolve_cache_lock = threading.Lock()
+
+
+def resolve_cache_clear() -> None:
+    """Drop all cached suffix-search results and resolved workspace roots."""
+    with _resolve_cache_lock:
+        _resolve_cache.clear()
+    _resolve_workspace.cache_clear()
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_workspace(workspace_dir: Path) -> Path:
+    """Resolved workspace root (one realpath per root per process)."""
+    return workspace_dir.resolve()
+
+
+def list_files_in_dir(
+    root: Path, rel_base: Path, ignore: frozenset[str] = WORKSPACE_SEARCH_IGNORE
+) -> list[str]:
+    """List files under root (sorted, relative to rel_base), pruning ignored directories.
+
+    Uses os.scandir so ignored directories (e.g. node_modules) are never descended
+    into and entry types come from the directory listing instead of extra stats.
+    Symlinked directories are not followed.
+    """
+    files: list[str] = []
+    _scan_dir(os.fspath(root), os.fspath(rel_base), ignore, files)
+    return files
+
+
+def _scan_dir(dir_path: str, rel_base: str, ignore: frozenset[str], out: list[str]) -> None:
+    try:
+        with os.scandir(dir_path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.name in ignore:
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            _scan_dir(entry.path, rel_base, ignore, out)
+        elif entry.is_file():
+            out.append(os.path.relpath(entry.path, rel_base))
+
+
+def _iter_files(
+    root: str,
+    ignore: frozenset[str],
+    prune: Callable[[str], bool] | None = None,
+) -> Iterator[str]:
+    """Yield paths of files under root, breadth-first, pruning ignored directories.
+
+    Like _scan_dir, but lazy so callers can stop early; symlinked directories are
+    not followed and entry types come from the cached DirEntry info. prune(path)
+    is checked when a directory is about to be listed; True skips it.
+    """
+    pending = deque([root])
+    while pending:
+        dir_path = pending.popleft()
+        if prune is not None and prune(dir_path):
+            continue
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if entry.name in ignore:
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
+
+
+async def git_list_files_in_dir(target_dir: Path, rel_base: Path) -> list[str] | None:
+    """List files under target_dir via `git ls-files`, honoring .gitignore.
+
+    Returns tracked plus untracked-but-not-ignored files that exist on disk, sorted
+    and relative to rel_base, with WORKSPACE_SEARCH_IGNORE applied as a safety net.
+    Returns None if git is unavailable or fails (e.g. not a repo), so callers can
+    fall back to list_files_in_dir.
+    """
+    listed = await _run_git_ls_files(target_dir, "-co", "--exclude-standard")
+    if listed is None:
+        return None
+    deleted = await _run_git_ls_files(target_dir, "-d")
+    if deleted:
+        deleted_set = set(deleted)
+        listed = [p for p in listed if p not in deleted_set]
+
+    prefix = os.path.relpath(target_dir, rel_base)
+    files = [
+        os.path.normpath(os.path.join(prefix, p))
+        for p in listed
+        if WORKSPACE_SEARCH_IGNORE.isdisjoint(p.split("/"))
+    ]
+    files.sort(key=lambda p: p.split(os.sep))
+    return files
+
+
+async def _run_git_ls_files(target_dir: Path, *args: str) -> list[str] | None:
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "git",
+            "-C",
+            os.fspath(target_dir),
+            "ls-files",
+            "-z",
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate()
+    except OSError as e:
+        logger.debug("git ls-files unavailable: %s", e)
+        return None
+    if proc.returncode != 0:
+        logger.debug(
+            "git ls-files failed (exit %s): %s",
+            proc.returncode,
+            stderr.decode("utf-8", errors="replace").strip(),
+        )
+        return None
+    return [p for p in stdout.decode("utf-8", errors="surrogateescape").split("\0") if p]
+
+
+def has_parent_segment(path: str) -> bool:
+    """Return True if path contains a '..' segment (a parent-directory reference)."""
+    return _PARENT_SEGMENT_RE.search(path) is not None
+
+
+def safe_resolve(workspace_resolved: Path, rel_path: str | Path) -> Path | None:
+    """Resolve rel_path under the workspace root; None if the real target escapes it.
+
+    This is the single containment rule for client paths: resolving follows
+    symlinks and collapses '.' / '..', so the check applies to the real target.
+
+    Args:
+        workspace_resolved: Already-resolved workspace root.
+        rel_path: Client-supplied path, relative to the workspace root.
+    """
+    # String realpath + prefix test: same rule as Path.resolve/is_relative_to,
+    # without building intermediate Path objects on this hot path.
+    root = os.fspath(workspace_resolved)
+    resolved = os.path.realpath(os.path.join(root, rel_path))
+    if resolved != root and not resolved.startswith(os.path.join(root, "")):
+        return None
+    return Path(resolved)
+
 
 def resolve_file_in_workspace(workspace_dir: Path, file_path: str) -> Path | None:
     """Resolve client file_path to an existing file under workspace_dir.
@@ -15,46 +183,69 @@ def resolve_file_in_workspace(workspace_dir: Path, file_path: str) -> Path | Non
     backend/database/models/feature.py when the real path is
     src/backend/database/models/feature.py). This tries the direct path first,
     then searches the workspace for any file whose relative path ends with
-    the given file_path.
+    the given file_path. Among several matches the shortest relative path wins
+    (the first one found on ties); directories that cannot hold a shorter match
+    are not listed.
 
     Returns:
-        Resolved absolute Path to the file, or None if not found or path
-        escapes workspace.
+        Resolved absolute Path to the file (always inside the workspace), or
+        None if not found or path escapes workspace.
     """
-    normalized = file_path.strip().lstrip("/").replace("\\", "/")
-    if not normalized or ".." in normalized:
+    # Normalize separators before trimming so a leading "\\" is stripped too.
+    normalized = file_path.replace("\\", "/").strip().lstrip("/")
+    if not normalized or has_parent_segment(normalized):
         return None
-    workspace_resolved = workspace_dir.resolve()
-    candidate = (workspace_dir / normalized).resolve()
-    if candidate.is_file() and candidate.is_relative_to(workspace_resolved):
+    workspace_resolved = _resolve_workspace(workspace_dir)
+    candidate = safe_resolve(workspace_resolved, normalized)
+    if candidate is not None and candidate.is_file():
         return candidate
-    # Search for a file whose relative path ends with the given path.
-    matches: list[Path] = []
-    for path in workspace_dir.rglob("*"):
-        if not path.is_file():
+    root = os.fspath(workspace_dir)
+    cache_key = (root, normalized)
+    with _resolve_cache_lock:
+        cached = _resolve_cache.get(cache_key)
+        if cached is not None:
+            _resolve_cache.move_to_end(cache_key)
+    if cached is not None:
+        if cached.is_file():
+            return cached
+        with _resolve_cache_lock:
+            _resolve_cache.pop(cache_key, None)
+
+    found = _search_suffix_match(root, workspace_resolved, normalized)
+    if found is not None:
+        with _resolve_cache_lock:
+            _resolve_cache[cache_key] = found
+            if len(_resolve_cache) > _RESOLVE_CACHE_SIZE:
+                _resolve_cache.popitem(last=False)
+    return found
+
+
+def _search_suffix_match(root: str, workspace_resolved: Path, normalized: str) -> Path | None:
+    """Walk the workspace for the shortest file path ending with normalized."""
+    prefix_len = len(os.path.join(root, ""))
+    # A match below a directory is at least "<dir>/<normalized>" long.
+    sep_normalized = "/" + normalized
+    min_extra = len(sep_normalized) - prefix_len
+    # normalized ends in a file name, so its last char never needs separator
+    # normalization; checking it first rejects most files before any slicing.
+    last_char = normalized[-1]
+    best_len = 0
+    best: Path | None = None
+
+    def _cannot_beat_best(dir_path: str) -> bool:
+        return best is not None and len(dir_path) + min_extra >= best_len
+
+    for path in _iter_files(root, WORKSPACE_SEARCH_IGNORE, _cannot_beat_best):
+        if path[-1] != last_char:
             continue
-        if any(ign in path.parts for ign in WORKSPACE_SEARCH_IGNORE):
+        rel_str = path[prefix_len:].replace("\\", "/")
+        if best is not None and len(rel_str) >= best_len:
             continue
-        try:
-            rel = path.relative_to(workspace_dir)
-            rel_str = str(rel).replace("\\", "/")
+        if rel_str == normalized or rel_str.endswith(sep_normalized):
+            resolved = safe_resolve(workspace_resolved, rel_str)
+            if resolved is None:
+                continue
             if rel_str == normalized:
-                matches.append(path.resolve())
-            elif rel_str.endswith(normalized) and (
-                len(rel_str) == len(normalized) or rel_str[-len(normalized) - 1] == "/"
-            ):
-                matches.append(path.resolve())
-        except ValueError:
-            continue
-    if not matches:
-        return None
-    if len(matches) == 1:
-        return matches[0]
-    # Prefer exact relative path match.
-    for m in matches:
-        try:
-            if str(m.relative_to(workspace_dir)).replace("\\", "/") == normalized:
-                return m
-        except ValueError:
-            continue
-    return min(matches, key=lambda p: len(str(p)))
+                return resolved
+            best, best_len = resolved, len(rel_str)
+    return best
@@ -1,7 +1,32 @@
 """Pytest configuration and fixtures."""
 
 import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
 
 # Set WORKSPACE_DIR before any module imports agent/config (default /workspace may not exist).
 if not os.environ.get("WORKSPACE_DIR"):
     os.environ["WORKSPACE_DIR"] = os.getcwd()
+
+
+@pytest.fixture
+def workspace_factory(tmp_path: Path) -> Callable[[Iterable[tuple[str, str]]], Path]:
+    """Build a workspace under tmp_path from (relative path, content) pairs.
+
+    Parent directories are created once each, then files are written on a
+    thread pool so large stress workspaces do not pay syscall latency serially.
+    Returns tmp_path.
+    """
+
+    def build(files: Iterable[tuple[str, str]]) -> Path:
+        entries = [(tmp_path / rel, content) for rel, content in files]
+        for parent in {path.parent for path, _ in entries}:
+            os.makedirs(parent, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda entry: entry[0].write_text(entry[1]), entries))
+        return tmp_path
+
+    return build
@@ -1,11 +1,16 @@
-"""Unit tests for agent review comment writing."""
+"""Unit tests for agent review comment writing and section-based review."""
 
+import asyncio
+import dataclasses
 import tempfile
 from pathlib import Path
 
 import pytest
 
+import agent
+import config as config_module
 from agent import write_review_comments
+from review_strategy import ReviewOrchestrator
 
 
 def test_write_review_comments_preserves_multiline_comment() -> None:
@@ -48,3 +53,262 @@ def test_write_review_comments_multiple_lines_same_line_number() -> None:
         assert "Second point with details:" in content
         assert "detail A" in content
         assert "detail B" in content
+
+
+def _make_sectioned_python(num_functions: int, body_lines: int = 40) -> str:
+    """Build a Python source with an imports block and num_functions top-level functions.
+
+    The imports block is long enough not to be skipped as trivial.
+    """
+    chunks = ["import ast", "import json", "import os", "import re", "import sys"]
+    for n in range(num_functions):
+        chunks.append(f"def func_{n}():")
+        chunks.extend(f"    x_{i} = {i}" for i in range(body_lines))
+    return "\n".join(chunks) + "\n"
+
+
+def _override_settings(monkeypatch, **changes) -> None:
+    """Replace config settings for the duration of a test."""
+    monkeypatch.setattr(
+        config_module, "settings", dataclasses.replace(config_module.settings, **changes)
+    )
+
+
+def _user_text(messages: list[dict]) -> str:
+    """Return the user message text from a chat messages list."""
+    return next(m["content"] for m in messages if m["role"] == "user")
+
+
+def test_section_based_review_runs_sections_concurrently(monkeypatch) -> None:
+    """Section prompts are dispatched concurrently and comments keep section order."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_call_llm(messages: list[dict]) -> str:
+        nonlocal in_flight, max_in_flight
+        prompt = _user_text(messages)
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if "CURRENT SECTION: imports" in prompt:
+            return "[LINE 1] PRAISE: imports"
+        name = prompt.split('CURRENT SECTION: function "', 1)[1].split('"', 1)[0]
+        return f"[LINE 2] SUGGESTION: {name}"
+
+    monkeypatch.setattr(agent, "_call_llm", fake_call_llm)
+    _override_settings(monkeypatch, llm_batch_size=1)
+    content = _make_sectioned_python(4)
+    orchestrator = ReviewOrchestrator()
+    result = asyncio.run(
+        agent._perform_section_based_review(
+            Path("big.py"), content, "standard", None, orchestrator
+        )
+    )
+
+    assert max_in_flight > 1
+    assert result.splitlines() == [
+        "[LINE 1] PRAISE: imports",
+        "[LINE 2] SUGGESTION: func_0",
+        "[LINE 2] SUGGESTION: func_1",
+        "[LINE 2] SUGGESTION: func_2",
+        "[LINE 2] SUGGESTION: func_3",
+    ]
+    assert orchestrator.iterations_used == 5
+
+
+def test_section_based_review_context_followup(monkeypatch) -> None:
+    """A REQUEST_CONTEXT response triggers one follow-up whose comments join that section."""
+
+    async def fake_call_llm(messages: list[dict]) -> str:
+        prompt = _user_text(messages)
+        if prompt.startswith("You are continuing"):
+            return "[LINE 3] QUESTION: followup"
+        if 'CURRENT SECTION: function "func_1"' in prompt:
+            return "REQUEST_CONTEXT: function func_0\n[LINE 2] SUGGESTION: func_1"
+        return ""
+
+    monkeypatch.setattr(agent, "_call_llm", fake_call_llm)
+    _override_settings(monkeypatch, llm_batch_size=1)
+    content = _make_sectioned_python(3)
+    orchestrator = ReviewOrchestrator()
+    result = asyncio.run(
+        agent._perform_section_based_review(
+            Path("big.py"), content, "standard", None, orchestrator
+        )
+    )
+
+    assert result.splitlines() == [
+        "[LINE 2] SUGGESTION: func_1",
+        "[LINE 3] QUESTION: followup",
+    ]
+    assert orchestrator.iterations_used == 5
+
+
+def test_section_based_review_batches_sections(monkeypatch) -> None:
+    """Sections are packed into batched calls and blocks are routed back per section."""
+    prompts: list[str] = []
+
+    async def fake_call_llm(messages: list[dict]) -> str:
+        prompt = _user_text(messages)
+        prompts.append(prompt)
+        if prompt.startswith("You are reviewing"):
+            # Answer only the first two sections of the batch.
+            return "### SECTION 1\n[LINE 1] PRAISE: one\n### SECTION 2\n[LINE 2] SUGGESTION: two"
+        return "[LINE 5] QUESTION: retried"
+
+    monkeypatch.setattr(agent, "_call_llm", fake_call_llm)
+    _override_settings(monkeypatch, llm_batch_size=3)
+    content = _make_sectioned_python(3)
+    orchestrator = ReviewOrchestrator()
+    result = asyncio.run(
+        agent._perform_section_based_review(
+            Path("big.py"), content, "standard", None, orchestrator
+        )
+    )
+
+    # 4 sections -> batch of 3 + single; the missing third section is retried alone.
+    assert len(prompts) == 3
+    assert result.splitlines() == [
+        "[LINE 1] PRAISE: one",
+        "[LINE 2] SUGGESTION: two",
+        "[LINE 5] QUESTION: retried",
+        "[LINE 5] QUESTION: retried",
+    ]
+    assert orchestrator.iterations_used == 4
+
+
+def test_http_client_is_shared_with_litellm() -> None:
+    """The pooled HTTP client is reused across calls and registered with LiteLLM."""
+    client = agent.get_http_client()
+    assert agent.get_http_client() is client
+    assert agent.litellm.aclient_session is client
+
+    asyncio.run(agent.aclose_http_client())
+    assert client.is_closed
+    assert agent.litellm.aclient_session is None
+    assert agent.get_http_client() is not client
+
+
+def test_prewarm_http_client_ignores_connection_errors(monkeypatch) -> None:
+    """Pre-warm is best-effort: an unreachable endpoint does not raise."""
+    calls = []
+
+    async def failing_head(url, **kwargs):
+        calls.append(url)
+        raise agent.httpx.ConnectError("unreachable")
+
+    client = agent.get_http_client()
+    monkeypatch.setattr(client, "head", failing_head)
+    asyncio.run(agent.prewarm_http_client())
+    assert len(calls) == 2
+    assert all(url.endswith("/models") for url in calls)
+
+
+def test_add_line_numbers_pads_and_numbers_from_one() -> None:
+    """Line numbers are right-aligned to 4 columns and widen for long files."""
+    assert agent.add_line_numbers("a\nb\n") == "   1 | a\n   2 | b"
+    numbered = agent.add_line_numbers("x\n" * 10000).splitlines()
+    assert numbered[0] == "   1 | x"
+    assert numbered[-1] == "10000 | x"
+
+
+def test_read_file_content_falls_back_to_latin1_and_normalizes_newlines(tmp_path: Path) -> None:
+    """Non-UTF-8 bytes decode as latin-1; CRLF / CR become LF like a text-mode read."""
+    path = tmp_path / "legacy.py"
+    path.write_bytes(b"x = '\xe9'\r\ny = 2\rz = 3\n")
+    assert agent.read_file_content(path) == "x = 'é'\ny = 2\nz = 3\n"
+
+
+def test_atomic_write_fsyncs_file_and_directory(tmp_path: Path, monkeypatch) -> None:
+    """Content is fsynced before the rename and the directory after; no temp file is left."""
+    synced = []
+    real_fsync = agent.os.fsync
+
+    def recording_fsync(fd: int) -> None:
+        synced.append(fd)
+        real_fsync(fd)
+
+    monkeypatch.setattr(agent.os, "fsync", recording_fsync)
+    target = tmp_path / "a.py"
+    target.write_text("old")
+    agent._atomic_write(target, "new")
+
+    assert target.read_text() == "new"
+    assert len(synced) == 2
+    assert [p.name for p in tmp_path.iterdir()] == ["a.py"]
+
+
+def test_write_review_comments_inserts_blocks_before_lines(tmp_path: Path) -> None:
+    """Comment blocks land right before their target line with the file's comment style."""
+    path = tmp_path / "page.html"
+    original = "<p>a</p>\n<p>b</p>\n"
+    path.write_text(original, encoding="utf-8")
+
+    write_review_comments(path, original, "[LINE 2] SUGGESTION: use a list\nof items")
+
+    assert path.read_text(encoding="utf-8") == (
+        "<p>a</p>\n"
+        "<!-- === CODE REVIEW COMMENT === -->\n"
+        "<!-- SUGGESTION: use a list -->\n"
+        "<!-- of items -->\n"
+        f"<!-- {'=' * 50} -->\n"
+        "<p>b</p>"
+    )
+
+
+def test_write_review_comments_without_line_markers_prepends_summary(tmp_path: Path) -> None:
+    """A review with no [LINE N] comments is written as a header block above the file."""
+    path = tmp_path / "example.py"
+    original = "a = 1\n"
+    path.write_text(original, encoding="utf-8")
+
+    write_review_comments(path, original, "Looks fine.\nNo issues.")
+
+    assert path.read_text(encoding="utf-8") == (
+        "# === CODE REVIEW RESULTS ===\n"
+        "# Looks fine.\n"
+        "# No issues.\n"
+        f"# {'=' * 50}\n\n"
+        "a = 1\n"
+    )
+
+
+def test_write_review_comments_skips_malformed_line_markers(tmp_path: Path) -> None:
+    """A [LINE ...] marker without a number is dropped along with its continuation lines."""
+    path = tmp_path / "example.py"
+    original = "a = 1\nb = 2\n"
+    path.write_text(original, encoding="utf-8")
+
+    review = "[LINE 1] CRITICAL: kept\n[LINE x-y] SUGGESTION: dropped\ncontinuation dropped\n"
+    write_review_comments(path, original, review)
+
+    content = path.read_text(encoding="utf-8")
+    assert "# CRITICAL: kept" in content
+    assert "dropped" not in content
+
+
+def test_perform_code_review_reports_section_progress(monkeypatch, tmp_path: Path) -> None:
+    """Progress callback receives (completed, total) as section batches finish."""
+
+    async def fake_call_llm(messages: list[dict]) -> str:
+        return ""
+
+    monkeypatch.setattr(agent, "_call_llm", fake_call_llm)
+    _override_settings(monkeypatch, llm_batch_size=2)
+    path = tmp_path / "big.py"
+    content = _make_sectioned_python(4)
+    progress: list[tuple[int, int]] = []
+
+    async def on_progress(completed: int, total: int) -> None:
+        progress.append((completed, total))
+
+    asyncio.run(
+        agent.perform_code_review(
+            path, "quick", None, content=content, progress_cb=on_progress
+        )
+    )
+    # 5 sections in batches of 2, 2, 1: one report per batch, ending at 5/5.
+    assert len(progress) == 3
+    assert all(total == 5 for _, total in progress)
+    assert progress[-1] == (5, 5)
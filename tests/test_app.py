@@ -1,15 +1,22 @@
 """Tests for MCP app tool registration and param parsing."""
 
 import asyncio
+import dataclasses
+import shutil
+import subprocess
 from pathlib import Path
 
 import pytest
 
+import config as config_module
 from agent import ReviewFileInput
-from app import review_code_file
+from app import list_workspace_files, review_code_file
+import utils.path_utils as path_utils
 from utils import (
     parse_review_params,
+    resolve_cache_clear,
     resolve_file_in_workspace,
+    safe_resolve,
     salvage_params_from_string,
 )
 
@@ -53,6 +60,13 @@ def test_parse_review_params_non_dict_or_string_raises() -> None:
         parse_review_params(123)
 
 
+def test_parse_review_params_empty_input_raises_missing_params() -> None:
+    """None, empty strings and empty objects fail fast without pydantic validation."""
+    for raw in (None, "", "   ", {}, "{}"):
+        with pytest.raises(ValueError, match="Missing params"):
+            parse_review_params(raw)
+
+
 def test_salvage_extracts_file_path_from_malformed_string() -> None:
     """Malformed strings like {}'file_path: path' are salvaged."""
     assert salvage_params_from_string(
@@ -66,6 +80,25 @@ def test_salvage_extracts_file_path_from_malformed_string() -> None:
     ) == {"file_path": "src/app.py", "review_depth": "standard"}
 
 
+def test_salvage_detects_review_depth_case_insensitively() -> None:
+    """Depth words are found in any case; "thorough" wins even after "quick"."""
+    assert salvage_params_from_string("file_path: src/a.py QUICK")["review_depth"] == "quick"
+    assert (
+        salvage_params_from_string("file_path: src/a.py quick, no: Thorough")["review_depth"]
+        == "thorough"
+    )
+
+
+def test_salvage_returns_fresh_dict_for_repeated_input() -> None:
+    """Memoized salvage still hands each caller its own dict."""
+    first = salvage_params_from_string("file_path: src/app.py")
+    first["review_depth"] = "thorough"
+    assert salvage_params_from_string("file_path: src/app.py") == {
+        "file_path": "src/app.py",
+        "review_depth": "standard",
+    }
+
+
 def test_parse_review_params_salvages_malformed_string() -> None:
     """When JSON fails, we try to salvage file_path and accept the request."""
     result = parse_review_params("{}'file_path: backend/database/models/feature.py'")
@@ -94,6 +127,14 @@ def test_resolve_file_in_workspace_direct_path(tmp_path: Path) -> None:
     assert resolved.read_text() == "# app"
 
 
+def test_resolve_file_in_workspace_strips_leading_backslash(tmp_path: Path) -> None:
+    """Windows-style separators, including a leading one, resolve like '/'."""
+    (tmp_path / "src").mkdir()
+    f = tmp_path / "src" / "main.py"
+    f.write_text("# main")
+    assert resolve_file_in_workspace(tmp_path, "\\src\\main.py") == f.resolve()
+
+
 def test_resolve_file_in_workspace_suffix_path(tmp_path: Path) -> None:
     """Path that is a suffix of actual path (e.g. client sent path without src/) is found."""
     (tmp_path / "src" / "backend" / "database" / "models").mkdir(parents=True, exist_ok=True)
@@ -105,6 +146,65 @@ def test_resolve_file_in_workspace_suffix_path(tmp_path: Path) -> None:
     assert resolved.read_text() == "# feature"
 
 
+def test_resolve_file_in_workspace_suffix_search_skips_ignored_dirs(tmp_path: Path) -> None:
+    """Suffix search never descends into ignored directories such as node_modules."""
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg" / "index.js").write_text("")
+    (tmp_path / "web" / "pkg").mkdir(parents=True)
+    (tmp_path / "web" / "pkg" / "index.js").write_text("")
+    assert resolve_file_in_workspace(tmp_path, "pkg/index.js") == (
+        tmp_path / "web" / "pkg" / "index.js"
+    ).resolve()
+
+
+def test_resolve_file_in_workspace_prefers_shortest_suffix_match(tmp_path: Path) -> None:
+    """When several files end with the path, the least nested one is returned."""
+    for parent in ("a/b/c", "x", "y/z"):
+        (tmp_path / parent / "pkg").mkdir(parents=True)
+        (tmp_path / parent / "pkg" / "mod.py").write_text("")
+    assert resolve_file_in_workspace(tmp_path, "pkg/mod.py") == (
+        tmp_path / "x" / "pkg" / "mod.py"
+    ).resolve()
+
+
+def test_resolve_file_in_workspace_suffix_search_large_workspace(workspace_factory) -> None:
+    """Suffix search over a wide, deep tree finds the least nested match only."""
+    files = [(f"pkg{i}/sub{j}/mod{k}.py", "") for i in range(20) for j in range(5) for k in range(10)]
+    files += [("deep/a/b/c/target/mod.py", ""), ("lib/target/mod.py", "")]
+    files += [(f"node_modules/dep{i}/target/mod.py", "") for i in range(50)]
+    workspace = workspace_factory(files)
+    assert resolve_file_in_workspace(workspace, "target/mod.py") == (
+        workspace / "lib" / "target" / "mod.py"
+    ).resolve()
+    # Equal-length matches tie on scandir order, so only the shape is fixed.
+    tied = resolve_file_in_workspace(workspace, "sub4/mod9.py")
+    assert tied is not None
+    assert tied.relative_to(workspace.resolve()).parts[1:] == ("sub4", "mod9.py")
+
+
+def test_resolve_file_in_workspace_caches_suffix_matches(tmp_path: Path, monkeypatch) -> None:
+    """A repeated suffix lookup skips the walk; a cached file that is gone is searched again."""
+    resolve_cache_clear()
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    target = tmp_path / "src" / "pkg" / "mod.py"
+    target.write_text("")
+    assert resolve_file_in_workspace(tmp_path, "pkg/mod.py") == target.resolve()
+
+    walks = []
+    real_search = path_utils._search_suffix_match
+    monkeypatch.setattr(
+        path_utils,
+        "_search_suffix_match",
+        lambda *args: walks.append(args) or real_search(*args),
+    )
+    assert resolve_file_in_workspace(tmp_path, "pkg/mod.py") == target.resolve()
+    assert walks == []
+
+    target.unlink()
+    assert resolve_file_in_workspace(tmp_path, "pkg/mod.py") is None
+    assert len(walks) == 1
+
+
 def test_resolve_file_in_workspace_not_found(tmp_path: Path) -> None:
     """Nonexistent path returns None."""
     assert resolve_file_in_workspace(tmp_path, "nonexistent/file.py") is None
@@ -118,6 +218,45 @@ def test_resolve_file_in_workspace_rejects_traversal() -> None:
     assert resolve_file_in_workspace(workspace, "src/../../etc/passwd") is None
 
 
+def test_resolve_file_in_workspace_allows_dots_inside_names(tmp_path: Path) -> None:
+    """Only '..' path segments are traversal; '..' inside a file name is not."""
+    (tmp_path / "src").mkdir()
+    f = tmp_path / "src" / "my..file.py"
+    f.write_text("# dots")
+    assert resolve_file_in_workspace(tmp_path, "src/my..file.py") == f.resolve()
+    assert resolve_file_in_workspace(tmp_path, "my..file.py") == f.resolve()
+    assert salvage_params_from_string("file_path: src/my..file.py") is not None
+    assert salvage_params_from_string("file_path: src/../secret.py") is None
+
+
+def test_resolve_file_in_workspace_rejects_symlink_escape(tmp_path: Path) -> None:
+    """A symlink pointing outside the workspace is not resolved, directly or by suffix."""
+    workspace = tmp_path / "ws"
+    (workspace / "src").mkdir(parents=True)
+    outside = tmp_path / "secret.py"
+    outside.write_text("# secret")
+    (workspace / "src" / "link.py").symlink_to(outside)
+    assert resolve_file_in_workspace(workspace, "src/link.py") is None
+    assert resolve_file_in_workspace(workspace, "link.py") is None
+
+
+def test_safe_resolve_rejects_sibling_with_shared_prefix(tmp_path: Path) -> None:
+    """A sibling directory whose name extends the workspace name is outside it."""
+    workspace = (tmp_path / "ws").resolve()
+    workspace.mkdir()
+    (tmp_path / "ws2").mkdir()
+    assert safe_resolve(workspace, "a.py") == workspace / "a.py"
+    assert safe_resolve(workspace, ".") == workspace
+    assert safe_resolve(workspace, "../ws2/a.py") is None
+
+
+def test_review_file_input_allows_dotdot_rejects_absolute() -> None:
+    """'..' is left to workspace resolution; absolute paths are still rejected."""
+    assert ReviewFileInput(file_path="src/../main.py").file_path == "src/../main.py"
+    with pytest.raises(ValueError):
+        ReviewFileInput(file_path="/etc/passwd")
+
+
 def test_review_code_file_file_not_found_returns_error() -> None:
     """When file_path does not exist under workspace, return a clear file-not-found error."""
     result = asyncio.run(
@@ -126,3 +265,43 @@ def test_review_code_file_file_not_found_returns_error() -> None:
     assert "Error: File not found" in result
     assert "nonexistent/path/that/does/not/exist.py" in result
     assert "No file under the workspace matches" in result
+
+
+def test_list_workspace_files_skips_ignored_dirs(tmp_path: Path, monkeypatch) -> None:
+    """Files are listed sorted and relative to the workspace; ignored dirs are skipped."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "b.py").write_text("")
+    (tmp_path / "src" / "a.py").write_text("")
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg" / "index.js").write_text("")
+    monkeypatch.setattr(
+        config_module,
+        "settings",
+        dataclasses.replace(config_module.settings, workspace_dir=tmp_path),
+    )
+
+    result = asyncio.run(list_workspace_files(directory="."))
+    assert result == "Files in workspace (total: 2):\n\n  - src/a.py\n  - src/b.py\n"
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_list_workspace_files_uses_gitignore_in_git_repo(tmp_path: Path, monkeypatch) -> None:
+    """In a git workspace, .gitignore'd and deleted tracked files are not listed."""
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    (tmp_path / ".gitignore").write_text("build/\n")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.py").write_text("")
+    (tmp_path / "src" / "gone.py").write_text("")
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "out.js").write_text("")
+    subprocess.run(["git", "-C", str(tmp_path), "add", "src"], check=True)
+    (tmp_path / "src" / "gone.py").unlink()
+    (tmp_path / "src" / "new.py").write_text("")
+    monkeypatch.setattr(
+        config_module,
+        "settings",
+        dataclasses.replace(config_module.settings, workspace_dir=tmp_path),
+    )
+
+    result = asyncio.run(list_workspace_files(directory="src"))
+    assert result == "Files in workspace (total: 2):\n\n  - src/main.py\n  - src/new.py\n"
@@ -0,0 +1,77 @@
+"""Unit tests for the on-disk LLM response cache."""
+
+import asyncio
+import dataclasses
+from pathlib import Path
+
+import pytest
+
+import config as config_module
+import llm_cache
+
+
+@pytest.fixture
+def cache_enabled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Enable the cache with tmp_path as workspace; returns the cache directory."""
+    settings = dataclasses.replace(
+        config_module.settings, workspace_dir=tmp_path, review_cache=True
+    )
+    monkeypatch.setattr(config_module, "settings", settings)
+    return tmp_path / llm_cache.CACHE_DIR_NAME
+
+
+def test_cache_key_depends_on_model_and_prompt() -> None:
+    """Same prompt for a different model gets a different key."""
+    assert llm_cache.cache_key("m1", "p") == llm_cache.cache_key("m1", "p")
+    assert llm_cache.cache_key("m1", "p") != llm_cache.cache_key("m2", "p")
+    assert llm_cache.cache_key("m1", "p") != llm_cache.cache_key("m1", "q")
+
+
+def test_get_or_set_disabled_always_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    """With caching off, every call goes to the LLM."""
+    settings = dataclasses.replace(config_module.settings, review_cache=False)
+    monkeypatch.setattr(config_module, "settings", settings)
+    calls = []
+
+    async def call() -> str:
+        calls.append(1)
+        return "response"
+
+    async def run() -> None:
+        await llm_cache.get_or_set("prompt", call)
+        await llm_cache.get_or_set("prompt", call)
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_get_or_set_hit_skips_call(cache_enabled: Path) -> None:
+    """A cached prompt is served from disk; concurrent duplicates call once."""
+    calls = []
+
+    async def call() -> str:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "[LINE 1] PRAISE: ok"
+
+    async def run() -> list[str]:
+        first = await asyncio.gather(
+            llm_cache.get_or_set("prompt", call),
+            llm_cache.get_or_set("prompt", call),
+        )
+        return [*first, await llm_cache.get_or_set("prompt", call)]
+
+    assert asyncio.run(run()) == ["[LINE 1] PRAISE: ok"] * 3
+    assert len(calls) == 1
+    key = llm_cache.cache_key(config_module.settings.llm_model, "prompt")
+    assert llm_cache.cache_path(cache_enabled, key).read_text() == "[LINE 1] PRAISE: ok"
+
+
+def test_get_or_set_does_not_cache_empty_response(cache_enabled: Path) -> None:
+    """Empty responses are returned but not stored."""
+
+    async def call() -> str:
+        return ""
+
+    assert asyncio.run(llm_cache.get_or_set("prompt", call)) == ""
+    assert not cache_enabled.exists()
@@ -0,0 +1,66 @@
+"""Unit tests for prompt assembly."""
+
+from pathlib import Path
+
+from prompt import (
+    CODE_REVIEW_PROMPT,
+    REVIEW_PRIORITIES,
+    build_review_prompt,
+    build_section_context_followup_prompt,
+    build_section_review_prompt,
+)
+
+
+def _section_context(name: str, start: int, end: int) -> dict:
+    return {
+        "section_map": "SECTION MAP (for reference):\n  function a: lines 1-5",
+        "section_kind": "function",
+        "section_name": name,
+        "section_start_line": start,
+        "section_end_line": end,
+        "section_text": f"   {start} | def {name}(): ...",
+    }
+
+
+def test_section_prompts_share_cacheable_system_prefix() -> None:
+    """All section and follow-up prompts of a file start with the same cached system message."""
+    path = Path("src/big.py")
+    first = build_section_review_prompt(path, _section_context("a", 1, 5), "quick", None)
+    second = build_section_review_prompt(path, _section_context("b", 6, 9), "quick", None)
+    followup = build_section_context_followup_prompt(
+        path, _section_context("b", 6, 9), "   1 | def a(): ...", "quick", None
+    )
+
+    assert first[0] == second[0] == followup[0]
+    system = first[0]
+    assert system["role"] == "system"
+    assert system["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert "REVIEW PRIORITIES" in system["content"][0]["text"]
+    assert "SECTION MAP" in system["content"][0]["text"]
+
+    assert 'CURRENT SECTION: function "b" (lines 6-9)' in second[1]["content"]
+    assert "def b()" in second[1]["content"]
+    assert "Do NOT output REQUEST_CONTEXT again" in followup[1]["content"]
+    assert "def a()" in followup[1]["content"]
+
+
+def test_build_review_prompt_includes_content_and_focus() -> None:
+    """Whole-file prompt embeds priorities, file path, content and focus areas."""
+    prompt = build_review_prompt(Path("x.py"), "   1 | x = 1", "thorough", "security")
+    assert "REVIEW PRIORITIES" in prompt
+    assert "FILE: x.py" in prompt
+    assert "   1 | x = 1" in prompt
+    assert "Pay particular attention to: security" in prompt
+    assert "in-depth analysis" in prompt
+
+
+def test_build_review_prompt_matches_full_template() -> None:
+    """Pre-rendering the priorities block does not change the formatted prompt."""
+    prompt = build_review_prompt(Path("x.py"), "   1 | d = {}", "quick", None)
+    assert prompt == CODE_REVIEW_PROMPT.format(
+        priorities=REVIEW_PRIORITIES,
+        file_path="x.py",
+        depth_instruction="Perform a quick scan focusing on obvious issues and critical problems.",
+        focus_instruction="",
+        content="   1 | d = {}",
+    )
@@ -0,0 +1,72 @@
+"""Unit tests for LLM rate limiting and retry helpers."""
+
+import asyncio
+import time
+
+import pytest
+
+import rate_limit
+from rate_limit import TokenBucket, per_minute_bucket, retry_with_backoff
+
+
+def test_token_bucket_waits_for_refill() -> None:
+    """Once the burst is spent, acquire waits roughly tokens / rate seconds."""
+
+    async def run() -> float:
+        bucket = TokenBucket(rate=20.0, capacity=2.0)
+        await bucket.acquire(2)
+        start = time.monotonic()
+        await bucket.acquire(1)
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 0.04
+
+
+def test_token_bucket_clamps_oversized_request() -> None:
+    """A request larger than capacity does not wait forever."""
+
+    async def run() -> None:
+        bucket = TokenBucket(rate=1000.0, capacity=5.0)
+        await asyncio.wait_for(bucket.acquire(50), timeout=1)
+
+    asyncio.run(run())
+
+
+def test_per_minute_bucket_disabled_for_zero() -> None:
+    """A zero limit means no governor."""
+    assert per_minute_bucket(0) is None
+    bucket = per_minute_bucket(120)
+    assert bucket is not None
+    assert bucket.rate == 2.0
+    assert bucket.capacity == 120.0
+
+
+def test_retry_with_backoff_retries_transient_errors(monkeypatch) -> None:
+    """Transient errors are retried up to the limit; other errors propagate immediately."""
+
+    async def no_sleep(delay: float) -> None:
+        return None
+
+    monkeypatch.setattr(rate_limit.asyncio, "sleep", no_sleep)
+    attempts = []
+
+    async def flaky() -> str:
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("busy")
+        return "ok"
+
+    assert asyncio.run(retry_with_backoff(flaky, (ConnectionError,), retries=3)) == "ok"
+    assert len(attempts) == 3
+
+    async def always_busy() -> str:
+        raise ConnectionError("busy")
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(retry_with_backoff(always_busy, (ConnectionError,), retries=2))
+
+    async def broken() -> str:
+        raise KeyError("bug")
+
+    with pytest.raises(KeyError):
+        asyncio.run(retry_with_backoff(broken, (ConnectionError,), retries=5))
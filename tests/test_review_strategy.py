@@ -94,6 +94,23 @@ def test_resolve_section_identifier_unknown_returns_none() -> None:
     assert orchestrator.resolve_section_identifier("unknown_thing") is None
 
 
+def test_resolve_section_identifier_prefers_first_section_and_tracks_reassignment() -> None:
+    """The earliest matching section wins; replacing sections rebuilds the lookup."""
+
+    def section(kind: str, name: str, start: int) -> Section:
+        return Section(kind=kind, name=name, start_line=start, end_line=start, text="x")
+
+    first = section("function", "handler", 1)
+    second = section("class", "Handler", 2)
+    orchestrator = ReviewOrchestrator()
+    orchestrator.sections = [first, second]
+    assert orchestrator.resolve_section_identifier("Handler") is first
+    assert orchestrator.resolve_section_identifier("class handler") is second
+
+    orchestrator.sections = [second]
+    assert orchestrator.resolve_section_identifier("handler") is second
+
+
 def test_parse_context_request_extracts_identifier() -> None:
     """REQUEST_CONTEXT line is parsed and identifier returned."""
     orchestrator = ReviewOrchestrator()
@@ -118,6 +135,40 @@ def test_parse_review_comments_extracts_line_comments() -> None:
     assert "[LINE 10]" in comments[1]
 
 
+def test_parse_response_returns_comments_and_context_request() -> None:
+    """One call yields both the [LINE] comments and the REQUEST_CONTEXT identifier."""
+    orchestrator = ReviewOrchestrator()
+    text = "  [LINE 3] CRITICAL: bug\nREQUEST_CONTEXT: class Handler\n[LINE 7] PRAISE: ok"
+    assert orchestrator.parse_response(text) == (
+        ["[LINE 3] CRITICAL: bug", "[LINE 7] PRAISE: ok"],
+        "class Handler",
+    )
+    assert orchestrator.parse_response("[LINE 1] SUGGESTION: x") == (
+        ["[LINE 1] SUGGESTION: x"],
+        None,
+    )
+
+
+def test_should_review_skips_trivial_sections() -> None:
+    """Short imports and literal-only Python globals are skipped; code sections are not."""
+    orchestrator = ReviewOrchestrator()
+
+    def section(kind: str, text: str) -> Section:
+        return Section(kind=kind, name=kind, start_line=1, end_line=1, text=text)
+
+    py = Path("m.py")
+    assert not orchestrator.should_review(section("imports", "import os"), py)
+    assert orchestrator.should_review(
+        section("imports", "\n".join(f"import m{i}" for i in range(5))), py
+    )
+    assert not orchestrator.should_review(
+        section("globals", "DEBUG = False\nNAMES: tuple = ('a', 'b')"), py
+    )
+    assert orchestrator.should_review(section("globals", "logger = get_logger()"), py)
+    assert orchestrator.should_review(section("globals", "const A = 1;"), Path("m.js"))
+    assert orchestrator.should_review(section("function", "def f(): pass"), py)
+
+
 def test_add_line_numbers_to_section() -> None:
     """Section text gets line numbers matching original file."""
     section = Section(
@@ -132,3 +183,29 @@ def test_add_line_numbers_to_section() -> None:
     assert lines[0].startswith("  14 |")
     assert lines[1].startswith("  15 |")
     assert len(lines) >= 2  # section.text splitlines() may omit trailing blank
+
+
+def test_split_batch_response_routes_blocks_by_index() -> None:
+    """Batched responses are split on '### SECTION <index>' headers; out-of-range ones are ignored."""
+    orchestrator = ReviewOrchestrator()
+    text = (
+        "### SECTION 1\n[LINE 3] CRITICAL: a\n"
+        "### SECTION 3\nREQUEST_CONTEXT: function f\n[LINE 9] SUGGESTION: c\n"
+        "### SECTION 7\n[LINE 1] PRAISE: ignored"
+    )
+    blocks = orchestrator.split_batch_response(text, 3)
+    assert blocks == {
+        0: "[LINE 3] CRITICAL: a",
+        2: "REQUEST_CONTEXT: function f\n[LINE 9] SUGGESTION: c",
+    }
+
+
+def test_section_map_built_lazily_and_reset_on_prepare() -> None:
+    """section_map is derived from the prepared sections and rebuilt for each file."""
+    orchestrator = ReviewOrchestrator()
+    assert orchestrator.section_map == ""
+    orchestrator.prepare_sections("def f():\n    pass\n", Path("a.py"))
+    assert "function f: lines 1-2" in orchestrator.section_map
+    orchestrator.prepare_sections("class G:\n    pass\n", Path("b.py"))
+    assert "class G: lines 1-2" in orchestrator.section_map
+    assert "function f" not in orchestrator.section_map
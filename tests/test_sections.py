@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from sections import Section, build_section_map, parse_sections
 
 
@@ -119,3 +121,22 @@ async def fetch_data():
     async_section = next(s for s in funcs if s.name == "fetch_data")
     assert "async def fetch_data" in async_section.text
     assert async_section.identifier.startswith("function fetch_data")
+
+
+def test_section_text_same_for_lf_and_crlf_content() -> None:
+    """Section text is newline-joined whether it comes from slicing or re-joining lines."""
+    lf = "import os\n\ndef f():\n    return 1\n\n\ndef g():\n    pass\n"
+    lf_sections = parse_sections(lf, Path("m.py"))
+    crlf_sections = parse_sections(lf.replace("\n", "\r\n"), Path("m.py"))
+    assert [s.text for s in lf_sections] == [s.text for s in crlf_sections]
+    assert [s.text for s in lf_sections] == [
+        "import os",
+        "def f():\n    return 1\n\n",
+        "def g():\n    pass",
+    ]
+
+
+def test_section_rejects_end_before_start() -> None:
+    """A section whose end_line precedes start_line is invalid."""
+    with pytest.raises(ValueError):
+        Section(kind="function", name="f", start_line=5, end_line=4, text="")